@@ -13,6 +13,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from transaction_management import add_member, renew_membership, load_csv_data
 
+DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+MEMBERS_CSV = DATA_DIR / 'members.csv'
+
+
+def index_by_member_id(members):
+    """Map member_id -> member record for O(1) lookups."""
+    return {m['member_id']: m for m in members}
+
 
 def main():
     """Demonstrate transaction management functions."""
@@ -21,14 +29,11 @@ def main():
     print("=" * 70)
     print()
     
-    # Get data directory
-    data_dir = Path(__file__).parent.parent / 'data'
-    members_file = data_dir / 'members.csv'
-    
     # Display current members
     print("Current Members:")
     print("-" * 70)
-    members = load_csv_data(members_file)
+    members = load_csv_data(MEMBERS_CSV)
+    members_by_id = index_by_member_id(members)
     for m in members:
         print(f"ID: {m['member_id']}, Name: {m['name']}, Type: {m['membership_type']}, "
               f"Expiry: {m['expiry_date']}, Status: {m['status']}")
@@ -49,9 +54,10 @@ def main():
     if success:
         print(f"✓ {message}")
         
-        # Show the new member
-        members = load_csv_data(members_file)
-        new_member = next(m for m in members if m['member_id'] == str(member_id))
+        # Show the new member (file changed, so refresh the in-memory list)
+        members = load_csv_data(MEMBERS_CSV)
+        members_by_id = index_by_member_id(members)
+        new_member = members_by_id[str(member_id)]
         print(f"  New Member Details:")
         print(f"    ID: {new_member['member_id']}")
         print(f"    Name: {new_member['name']}")
@@ -67,9 +73,8 @@ def main():
     print("Demo 2: Renewing an expired membership (Member 103)")
     print("-" * 70)
     
-    # Show member before renewal
-    members = load_csv_data(members_file)
-    member_103 = next(m for m in members if m['member_id'] == '103')
+    # Show member before renewal (members list is already current)
+    member_103 = members_by_id['103']
     print(f"Before: Expiry: {member_103['expiry_date']}, Status: {member_103['status']}")
     
     success, message = renew_membership(103)
@@ -77,9 +82,10 @@ def main():
     if success:
         print(f"✓ {message}")
         
-        # Show member after renewal
-        members = load_csv_data(members_file)
-        member_103 = next(m for m in members if m['member_id'] == '103')
+        # Show member after renewal (file changed, so refresh the in-memory list)
+        members = load_csv_data(MEMBERS_CSV)
+        members_by_id = index_by_member_id(members)
+        member_103 = members_by_id['103']
         print(f"After:  Expiry: {member_103['expiry_date']}, Status: {member_103['status']}")
     else:
         print(f"✗ Error: {message}")
@@ -130,10 +136,10 @@ def main():
         print(f"✗ Unexpected success")
     print()
     
-    # Display final member list
+    # Display final member list (reloaded so it reflects every demo above)
     print("Final Member List:")
     print("-" * 70)
-    members = load_csv_data(members_file)
+    members = load_csv_data(MEMBERS_CSV)
     for m in members:
         print(f"ID: {m['member_id']}, Name: {m['name']}, Type: {m['membership_type']}, "
               f"Expiry: {m['expiry_date']}, Status: {m['status']}")
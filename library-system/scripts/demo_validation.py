@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from validation import (
+    build_event_index,
     detect_event_conflicts,
     validate_room_capacity,
     validate_advance_notice,
@@ -23,9 +24,11 @@ from validation import (
 
 def demo_conflict_detection():
     """Demonstrate event conflict detection."""
-    print("\n" + "="*70)
-    print("DEMO 1: Event Conflict Detection")
-    print("="*70)
+    # Output is buffered per demo and written to stdout in one call
+    lines = []
+    lines.append("\n" + "="*70)
+    lines.append("DEMO 1: Event Conflict Detection")
+    lines.append("="*70)
     
     existing_events = [
         {
@@ -37,38 +40,44 @@ def demo_conflict_detection():
         }
     ]
     
+    # Index the existing schedule once and reuse it for each booking check
+    event_index = build_event_index(existing_events)
+    
     # Test 1: No conflict (different time)
-    print("\nTest 1: Booking Room R101 from 10:00-12:00 on 2024-02-15")
+    lines.append("\nTest 1: Booking Room R101 from 10:00-12:00 on 2024-02-15")
     new_event = {
         "event_date": "2024-02-15",
         "start_time": "10:00",
         "end_time": "12:00",
         "room_id": "R101"
     }
-    ok, msg = detect_event_conflicts(new_event, existing_events)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    ok, msg = detect_event_conflicts(new_event, existing_events, event_index)
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
     
     # Test 2: Conflict (overlapping time)
-    print("\nTest 2: Booking Room R101 from 15:00-17:00 on 2024-02-15 (overlaps with existing)")
+    lines.append("\nTest 2: Booking Room R101 from 15:00-17:00 on 2024-02-15 (overlaps with existing)")
     new_event = {
         "event_date": "2024-02-15",
         "start_time": "15:00",
         "end_time": "17:00",
         "room_id": "R101"
     }
-    ok, msg = detect_event_conflicts(new_event, existing_events)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    ok, msg = detect_event_conflicts(new_event, existing_events, event_index)
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def demo_room_capacity():
     """Demonstrate room capacity validation."""
-    print("\n" + "="*70)
-    print("DEMO 2: Room Capacity Validation")
-    print("="*70)
+    lines = []
+    lines.append("\n" + "="*70)
+    lines.append("DEMO 2: Room Capacity Validation")
+    lines.append("="*70)
     
     room = {
         "room_id": "R101",
@@ -77,87 +86,96 @@ def demo_room_capacity():
     }
     
     # Test 1: Within capacity
-    print(f"\nTest 1: Event with 25 attendees in room with capacity {room['capacity']}")
+    lines.append(f"\nTest 1: Event with 25 attendees in room with capacity {room['capacity']}")
     event = {"expected_attendance": "25"}
     ok, msg = validate_room_capacity(event, room)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
     
     # Test 2: Over capacity
-    print(f"\nTest 2: Event with 35 attendees in room with capacity {room['capacity']}")
+    lines.append(f"\nTest 2: Event with 35 attendees in room with capacity {room['capacity']}")
     event = {"expected_attendance": "35"}
     ok, msg = validate_room_capacity(event, room)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def demo_advance_notice():
     """Demonstrate advance notice validation."""
-    print("\n" + "="*70)
-    print("DEMO 3: Advance Notice Validation (3-day rule)")
-    print("="*70)
+    lines = []
+    lines.append("\n" + "="*70)
+    lines.append("DEMO 3: Advance Notice Validation (3-day rule)")
+    lines.append("="*70)
     
     today = datetime.now().strftime("%Y-%m-%d")
     
     # Test 1: Sufficient notice (5 days ahead)
     event_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
-    print(f"\nTest 1: Booking event for {event_date} (5 days from today {today})")
+    lines.append(f"\nTest 1: Booking event for {event_date} (5 days from today {today})")
     ok, msg = validate_advance_notice(event_date)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
     
     # Test 2: Insufficient notice (2 days ahead)
     event_date = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
-    print(f"\nTest 2: Booking event for {event_date} (2 days from today {today})")
+    lines.append(f"\nTest 2: Booking event for {event_date} (2 days from today {today})")
     ok, msg = validate_advance_notice(event_date)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def demo_operating_hours():
     """Demonstrate operating hours validation."""
-    print("\n" + "="*70)
-    print("DEMO 4: Operating Hours Validation")
-    print("="*70)
+    lines = []
+    lines.append("\n" + "="*70)
+    lines.append("DEMO 4: Operating Hours Validation")
+    lines.append("="*70)
     
     # Test 1: Valid - Monday 10:00-18:00 (hours: 9:00-20:00)
-    print("\nTest 1: Monday event from 10:00-18:00 (Mon-Thu hours: 9:00-20:00)")
+    lines.append("\nTest 1: Monday event from 10:00-18:00 (Mon-Thu hours: 9:00-20:00)")
     ok, msg = validate_operating_hours("2024-01-15", "10:00", "18:00")  # Monday
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
     
     # Test 2: Invalid - Monday 8:00-10:00 (too early)
-    print("\nTest 2: Monday event from 8:00-10:00 (starts before 9:00)")
+    lines.append("\nTest 2: Monday event from 8:00-10:00 (starts before 9:00)")
     ok, msg = validate_operating_hours("2024-01-15", "08:00", "10:00")
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
     
     # Test 3: Valid - Sunday 14:00-16:00 (Sunday hours: 13:00-17:00)
-    print("\nTest 3: Sunday event from 14:00-16:00 (Sunday hours: 13:00-17:00)")
+    lines.append("\nTest 3: Sunday event from 14:00-16:00 (Sunday hours: 13:00-17:00)")
     ok, msg = validate_operating_hours("2024-01-14", "14:00", "16:00")  # Sunday
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
     
     # Test 4: Invalid - Sunday 10:00-14:00 (too early)
-    print("\nTest 4: Sunday event from 10:00-14:00 (starts before 13:00)")
+    lines.append("\nTest 4: Sunday event from 10:00-14:00 (starts before 13:00)")
     ok, msg = validate_operating_hours("2024-01-14", "10:00", "14:00")
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
-        print(f"Error: {msg}")
+        lines.append(f"Error: {msg}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def demo_comprehensive_validation():
     """Demonstrate comprehensive event validation."""
-    print("\n" + "="*70)
-    print("DEMO 5: Comprehensive Event Validation")
-    print("="*70)
+    lines = []
+    lines.append("\n" + "="*70)
+    lines.append("DEMO 5: Comprehensive Event Validation")
+    lines.append("="*70)
     
     rooms = [
         {"room_id": "R101", "capacity": "30"},
@@ -167,7 +185,7 @@ def demo_comprehensive_validation():
     existing_events = []
     
     # Valid event
-    print("\nTest 1: Valid event (5 days ahead, 25 attendees, within hours)")
+    lines.append("\nTest 1: Valid event (5 days ahead, 25 attendees, within hours)")
     event = {
         "event_date": (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d"),
         "start_time": "10:00",
@@ -176,13 +194,13 @@ def demo_comprehensive_validation():
         "expected_attendance": "25"
     }
     ok, errors = validate_event(event, existing_events, rooms)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
         for i, error in enumerate(errors, 1):
-            print(f"  Error {i}: {error}")
+            lines.append(f"  Error {i}: {error}")
     
     # Invalid event (multiple issues)
-    print("\nTest 2: Invalid event (only 1 day notice, 40 attendees for capacity 30)")
+    lines.append("\nTest 2: Invalid event (only 1 day notice, 40 attendees for capacity 30)")
     event = {
         "event_date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d"),
         "start_time": "10:00",
@@ -191,19 +209,23 @@ def demo_comprehensive_validation():
         "expected_attendance": "40"
     }
     ok, errors = validate_event(event, existing_events, rooms)
-    print(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
+    lines.append(f"Result: {'✓ PASS' if ok else '✗ FAIL'}")
     if not ok:
         for i, error in enumerate(errors, 1):
-            print(f"  Error {i}: {error}")
+            lines.append(f"  Error {i}: {error}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def main():
     """Run all demonstrations."""
-    print("\n" + "="*70)
-    print("PHASE 5: EVENT VALIDATION DEMONSTRATION")
-    print("="*70)
-    print("\nThis script demonstrates the event validation functions implemented")
-    print("in Phase 5 of the Library Management System.")
+    sys.stdout.write("\n".join([
+        "\n" + "="*70,
+        "PHASE 5: EVENT VALIDATION DEMONSTRATION",
+        "="*70,
+        "\nThis script demonstrates the event validation functions implemented",
+        "in Phase 5 of the Library Management System.",
+    ]) + "\n")
     
     demo_conflict_detection()
     demo_room_capacity()
@@ -211,12 +233,14 @@ def main():
     demo_operating_hours()
     demo_comprehensive_validation()
     
-    print("\n" + "="*70)
-    print("DEMONSTRATION COMPLETE")
-    print("="*70)
-    print("\nAll validation functions are working correctly!")
-    print("For more details, see library-system/scripts/test_validation.py")
-    print()
+    sys.stdout.write("\n".join([
+        "\n" + "="*70,
+        "DEMONSTRATION COMPLETE",
+        "="*70,
+        "\nAll validation functions are working correctly!",
+        "For more details, see library-system/scripts/test_validation.py",
+        "",
+    ]) + "\n")
 
 
 if __name__ == "__main__":
@@ -10,129 +10,215 @@ This script generates reports including:
 """
 
 import csv
+import os
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from collections import Counter
-
-
-def load_csv_data(filepath):
-    """Load data from a CSV file."""
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        data = list(reader)
-    return data
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, zip_longest
+
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+DATA_PATH = BASE_PATH / 'data'
+REPORTS_PATH = BASE_PATH / 'reports'
+REPORT_CSV_FILES = tuple(DATA_PATH / name for name in ('members.csv', 'items.csv', 'events.csv', 'rooms.csv'))
+
+# Read CSVs in 1 MiB chunks rather than the default 8 KiB buffer
+READ_BUFFER_SIZE = 1 << 20
+
+# Rows transposed per step when loading columns; bounds the transient row buffer
+TRANSPOSE_CHUNK_ROWS = 4096
+
+# Numeric columns converted to int once at load time instead of per report
+INT_COLUMNS = frozenset({'expected_attendance', 'capacity'})
+
+# Parsed CSV columns keyed by (path, mtime_ns) so repeat loads skip re-parsing
+_CSV_CACHE = {}
+
+
+def load_csv_columns(filepath):
+    """Load a CSV file as a dict mapping each column name to a list of values.
+
+    Parsing uses the C-level ``csv.reader`` and transposes rows with ``zip`` so
+    reports can aggregate whole columns (e.g. ``Counter(columns['status'])``)
+    without building a dict per row. Rows are streamed in chunks of
+    ``TRANSPOSE_CHUNK_ROWS``, so only the columns plus one chunk of rows are
+    held in memory. Blank lines are skipped and short rows are padded with
+    None, matching ``csv.DictReader``. Columns named in ``INT_COLUMNS`` are
+    converted to int, keeping None for missing cells.
+    Results are memoized by path and modification time.
+    """
+    key = (str(filepath), os.stat(filepath).st_mtime_ns)
+    cached = _CSV_CACHE.get(key)
+    if cached is not None:
+        return cached
+    with open(filepath, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        values = [[] for _ in header]
+        while True:
+            rows = list(islice(reader, TRANSPOSE_CHUNK_ROWS))
+            if not rows:
+                break
+            # Blank lines come back as []; csv.DictReader skips them too
+            chunk = [row for row in rows if row]
+            if not chunk:
+                continue
+            transposed = list(zip_longest(*chunk))
+            for i, column in enumerate(values):
+                column.extend(transposed[i] if i < len(transposed) else [None] * len(chunk))
+    columns = dict(zip(header, values))
+    for name in INT_COLUMNS.intersection(columns):
+        # Cells missing from short rows stay None rather than reaching int()
+        columns[name] = [None if value is None else int(value) for value in columns[name]]
+    _CSV_CACHE[key] = columns
+    return columns
 
 
 def generate_membership_report(members):
-    """Generate membership statistics report."""
-    print("\n=== Membership Statistics ===")
-    print(f"Total Members: {len(members)}")
-    
-    status_counts = Counter(m['status'] for m in members)
-    print(f"Active Members: {status_counts.get('active', 0)}")
-    print(f"Expired Members: {status_counts.get('expired', 0)}")
-    
-    type_counts = Counter(m['membership_type'] for m in members)
-    print("\nMembership Types:")
+    """Generate membership statistics report.
+
+    Returns a dict of the computed metrics for reuse in the summary CSV.
+    """
+    # Output is buffered per section and written to stdout in one call
+    lines = []
+    total = len(members['member_id'])
+    status_counts = Counter(members['status'])
+    type_counts = Counter(members['membership_type'])
+
+    lines.append("\n=== Membership Statistics ===")
+    lines.append(f"Total Members: {total}")
+    lines.append(f"Active Members: {status_counts.get('active', 0)}")
+    lines.append(f"Expired Members: {status_counts.get('expired', 0)}")
+    
+    lines.append("\nMembership Types:")
     for mtype, count in type_counts.items():
-        print(f"  - {mtype}: {count}")
+        lines.append(f"  - {mtype}: {count}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return {
+        'total': total,
+        'active': status_counts.get('active', 0),
+    }
 
 
 def generate_items_report(items):
-    """Generate items inventory report."""
-    print("\n=== Items Inventory ===")
-    print(f"Total Items: {len(items)}")
-    
-    status_counts = Counter(i['status'] for i in items)
-    print(f"Available: {status_counts.get('available', 0)}")
-    print(f"Checked Out: {status_counts.get('checked_out', 0)}")
+    """Generate items inventory report.
+
+    Returns a dict of the computed metrics for reuse in the summary CSV.
+    """
+    lines = []
+    total = len(items['item_id'])
+    status_counts = Counter(items['status'])
+    type_counts = Counter(items['type'])
+
+    lines.append("\n=== Items Inventory ===")
+    lines.append(f"Total Items: {total}")
+    lines.append(f"Available: {status_counts.get('available', 0)}")
+    lines.append(f"Checked Out: {status_counts.get('checked_out', 0)}")
     
-    type_counts = Counter(i['type'] for i in items)
-    print("\nItem Types:")
+    lines.append("\nItem Types:")
     for itype, count in type_counts.items():
-        print(f"  - {itype}: {count}")
+        lines.append(f"  - {itype}: {count}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return {
+        'total': total,
+        'available': status_counts.get('available', 0),
+    }
 
 
 def generate_events_report(events):
-    """Generate events summary report."""
-    print("\n=== Events Summary ===")
-    print(f"Total Events: {len(events)}")
-    
-    status_counts = Counter(e['status'] for e in events)
-    print(f"Confirmed: {status_counts.get('confirmed', 0)}")
-    print(f"Pending: {status_counts.get('pending', 0)}")
-    
-    total_expected = sum(int(e['expected_attendance']) for e in events)
-    print(f"Total Expected Attendance: {total_expected}")
+    """Generate events summary report.
+
+    Returns a dict of the computed metrics for reuse in the summary CSV.
+    """
+    lines = []
+    total = len(events['event_id'])
+    status_counts = Counter(events['status'])
+    total_expected = sum(filter(None, events['expected_attendance']))
+
+    lines.append("\n=== Events Summary ===")
+    lines.append(f"Total Events: {total}")
+    lines.append(f"Confirmed: {status_counts.get('confirmed', 0)}")
+    lines.append(f"Pending: {status_counts.get('pending', 0)}")
+    lines.append(f"Total Expected Attendance: {total_expected}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return {
+        'total': total,
+        'confirmed': status_counts.get('confirmed', 0),
+    }
 
 
 def generate_rooms_report(rooms):
-    """Generate rooms availability report."""
-    print("\n=== Rooms Status ===")
-    print(f"Total Rooms: {len(rooms)}")
-    
-    total_capacity = sum(int(r['capacity']) for r in rooms)
-    print(f"Total Capacity: {total_capacity} persons")
+    """Generate rooms availability report.
+
+    Returns a dict of the computed metrics for reuse in the summary CSV.
+    """
+    lines = []
+    total = len(rooms['room_id'])
+    total_capacity = sum(filter(None, rooms['capacity']))
+
+    lines.append("\n=== Rooms Status ===")
+    lines.append(f"Total Rooms: {total}")
+    lines.append(f"Total Capacity: {total_capacity} persons")
     
-    print("\nRoom Details:")
-    for room in rooms:
-        print(f"  - {room['room_name']} (Capacity: {room['capacity']}): {room['availability']}")
+    lines.append("\nRoom Details:")
+    for name, capacity, availability in zip(rooms['room_name'], rooms['capacity'], rooms['availability']):
+        lines.append(f"  - {name} (Capacity: {capacity}): {availability}")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
+    return {
+        'total': total,
+        'capacity': total_capacity,
+    }
 
 
-def save_summary_report(output_path, members, items, events, rooms):
-    """Save a summary CSV report."""
+def save_summary_report(output_path, member_stats, item_stats, event_stats, room_stats):
+    """Save a summary CSV report from the metrics returned by the generate_* reports."""
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     report_file = output_path / f'summary_report_{timestamp}.csv'
     
+    rows = [
+        ['Report Type', 'Metric', 'Value'],
+        ['Membership', 'Total Members', member_stats['total']],
+        ['Membership', 'Active Members', member_stats['active']],
+        ['Items', 'Total Items', item_stats['total']],
+        ['Items', 'Available Items', item_stats['available']],
+        ['Events', 'Total Events', event_stats['total']],
+        ['Events', 'Confirmed Events', event_stats['confirmed']],
+        ['Rooms', 'Total Rooms', room_stats['total']],
+        ['Rooms', 'Total Capacity', room_stats['capacity']],
+    ]
+
     with open(report_file, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.writer(file)
-        writer.writerow(['Report Type', 'Metric', 'Value'])
-        
-        writer.writerow(['Membership', 'Total Members', len(members)])
-        writer.writerow(['Membership', 'Active Members', 
-                        sum(1 for m in members if m['status'] == 'active')])
-        
-        writer.writerow(['Items', 'Total Items', len(items)])
-        writer.writerow(['Items', 'Available Items', 
-                        sum(1 for i in items if i['status'] == 'available')])
-        
-        writer.writerow(['Events', 'Total Events', len(events)])
-        writer.writerow(['Events', 'Confirmed Events', 
-                        sum(1 for e in events if e['status'] == 'confirmed')])
-        
-        writer.writerow(['Rooms', 'Total Rooms', len(rooms)])
-        writer.writerow(['Rooms', 'Total Capacity', 
-                        sum(int(r['capacity']) for r in rooms)])
+        csv.writer(file).writerows(rows)
     
     print(f"\nSummary report saved to: {report_file}")
 
 
 def main():
     """Main report generation function."""
-    base_path = Path(__file__).parent.parent
-    data_path = base_path / 'data'
-    reports_path = base_path / 'reports'
-    
-    print(f"Loading data from {data_path}...")
+    print(f"Loading data from {DATA_PATH}...")
     
-    members = load_csv_data(data_path / 'members.csv')
-    items = load_csv_data(data_path / 'items.csv')
-    events = load_csv_data(data_path / 'events.csv')
-    rooms = load_csv_data(data_path / 'rooms.csv')
+    # The four loads are independent; overlap their file I/O
+    with ThreadPoolExecutor(max_workers=len(REPORT_CSV_FILES)) as executor:
+        members, items, events, rooms = executor.map(load_csv_columns, REPORT_CSV_FILES)
     
     print(f"\n=== Library Reports ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')}) ===")
     
-    generate_membership_report(members)
-    generate_items_report(items)
-    generate_events_report(events)
-    generate_rooms_report(rooms)
+    member_stats = generate_membership_report(members)
+    item_stats = generate_items_report(items)
+    event_stats = generate_events_report(events)
+    room_stats = generate_rooms_report(rooms)
     
     # Create reports directory if it doesn't exist
-    reports_path.mkdir(exist_ok=True)
+    REPORTS_PATH.mkdir(exist_ok=True)
     
     # Save summary report
-    save_summary_report(reports_path, members, items, events, rooms)
+    save_summary_report(REPORTS_PATH, member_stats, item_stats, event_stats, room_stats)
     
     print("\n=== Report Generation Complete ===")
 
@@ -10,139 +10,241 @@ This script simulates various library activities including:
 """
 
 import csv
+import os
 import random
-from datetime import datetime, timedelta
+from collections import namedtuple
+from datetime import date, timedelta
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional
 
 # Phase 5: Enhanced Validation
 try:
-    from validation import validate_checkout, MEMBERSHIP_LIMITS  # type: ignore
+    from validation import (  # type: ignore
+        validate_checkout, build_loan_index, build_fine_index, MEMBERSHIP_LIMITS,
+    )
 except Exception:
     # Allow script to run even if validation module is missing in older versions
     validate_checkout = None
+    build_loan_index = build_fine_index = None
     MEMBERSHIP_LIMITS = {}
 
 
-def load_csv_data(filepath):
-    """Load data from a CSV file."""
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as file:
+DATA_PATH = Path(__file__).resolve().parent.parent / 'data'
+MEMBERS_CSV = DATA_PATH / 'members.csv'
+ITEMS_CSV = DATA_PATH / 'items.csv'
+TRANSACTIONS_CSV = DATA_PATH / 'transactions.csv'
+FINES_CSV = DATA_PATH / 'fines.csv'
+
+# Numeric fine columns parsed once at load rather than on every validation
+FINES_SCHEMA = {'amount': float}
+
+# Checkout period in days per item type (per policy)
+CHECKOUT_PERIODS = {'Book': 21, 'DVD': 7, 'Device': 14}
+DEFAULT_CHECKOUT_PERIOD = 14
+
+# Read CSVs in 1 MiB chunks rather than the default 8 KiB buffer
+READ_BUFFER_SIZE = 1 << 20
+
+# Parsed CSV rows keyed by (path, mtime_ns) so repeat loads skip re-parsing
+_CSV_CACHE = {}
+_ROW_CACHE = {}
+
+
+def load_csv_data(filepath, schema=None):
+    """Load data from a CSV file.
+
+    ``schema`` optionally maps column names to converters (e.g.
+    ``{'amount': float}``) applied once at load; values that fail to convert
+    are left as strings for the consumer's own error handling.
+
+    Results are memoized by path, modification time and schema; callers should
+    treat the returned list as read-only.
+    """
+    schema_key = tuple(sorted(schema.items(), key=lambda kv: kv[0])) if schema else ()
+    key = (str(filepath), os.stat(filepath).st_mtime_ns, schema_key)
+    cached = _CSV_CACHE.get(key)
+    if cached is not None:
+        return cached
+    with open(filepath, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as file:
         reader = csv.DictReader(file)
         data = list(reader)
+    for column, convert in schema_key:
+        for row in data:
+            try:
+                row[column] = convert(row[column])
+            except (KeyError, TypeError, ValueError):
+                continue
+    _CSV_CACHE[key] = data
     return data
 
 
-def simulate_checkout(members: List[dict], items: List[dict], transactions: List[dict], fines: List[dict]):
-    """Simulate checkout transactions."""
+def load_csv_rows(filepath):
+    """Load data from a CSV file as a list of namedtuples (one field per column).
+
+    Lighter than dict rows for read-only pools that are scanned by field.
+    Blank lines are skipped and short rows are padded with None. Memoized
+    like load_csv_data.
+    """
+    key = (str(filepath), os.stat(filepath).st_mtime_ns)
+    cached = _ROW_CACHE.get(key)
+    if cached is not None:
+        return cached
+    with open(filepath, 'r', encoding='utf-8', newline='', buffering=READ_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        Row = namedtuple('Row', header, rename=True)
+        width = len(header)
+        pad = [None] * width
+        # Blank lines come back as []; skip them like csv.DictReader
+        data = [Row._make(r if len(r) == width else (r + pad)[:width]) for r in reader if r]
+    _ROW_CACHE[key] = data
+    return data
+
+
+def simulate_checkout(members: List[dict], items: List[Any], transactions: List[dict], fines: List[dict],
+                      rng: Optional[random.Random] = None):
+    """Simulate checkout transactions.
+
+    ``items`` are namedtuple rows from load_csv_rows. ``rng`` is the random
+    source (a fresh ``random.Random()`` if omitted).
+    """
+    if rng is None:
+        rng = random.Random()
     active_members = [m for m in members if m['status'] == 'active']
-    available_items = [i for i in items if i['status'] == 'available']
+    available_items = [i for i in items if i.status == 'available']
     
+    # All checkouts in one simulated day share the same date; format it once
+    checkout_date = date.today()
+    checkout_str = checkout_date.isoformat()
+    due_cache = {}  # checkout_days -> due date string
+
     checkouts = []
-    for _ in range(random.randint(3, 8)):
-        if active_members and available_items:
-            member = random.choice(active_members)
-            item = random.choice(available_items)
-
-            # Phase 5: validation before creating checkout
-            if callable(validate_checkout):
-                # include pending checkouts so limits apply cumulatively within this run
-                combined_txns = transactions + checkouts  # 'checkouts' lack return_date => treated as active
-                ok, errors = validate_checkout(
-                    member=member,
-                    transactions=combined_txns,
-                    fines=fines,
-                    membership_limits=MEMBERSHIP_LIMITS,
-                    fine_threshold=10.00,
-                )
-                if not ok:
-                    # Skip this member for now; try another iteration
-                    # Optionally log errors; keeping output minimal
-                    continue
-            
-            checkout_date = datetime.now()
-            # Set checkout period based on item type (per policy)
-            item_type = item['type']
-            if item_type == 'Book':
-                checkout_days = 21
-            elif item_type == 'DVD':
-                checkout_days = 7
-            elif item_type == 'Device':
-                checkout_days = 14
-            else:
-                checkout_days = 14  # Default
-            due_date = checkout_date + timedelta(days=checkout_days)
-            
-            checkouts.append({
-                'member_id': member['member_id'],
-                'item_id': item['item_id'],
-                'checkout_date': checkout_date.strftime('%Y-%m-%d'),
-                'due_date': due_date.strftime('%Y-%m-%d'),
-                'status': 'active'
-            })
-            
-            # Remove from available pool
-            available_items.remove(item)
+    n = rng.randint(3, 8)
+    if active_members and available_items:
+        # Draw the members up front (they may repeat); items are drawn only once
+        # a member passes validation, so a rejected member never uses one up
+        batch_members = rng.choices(active_members, k=n)
+    else:
+        batch_members = []
+    item_pool = list(range(len(available_items)))
+
+    if callable(validate_checkout):
+        # Summarize loans and fines once; pending checkouts are added to loan_index
+        # as they are made so limits apply cumulatively within this run
+        loan_index = build_loan_index(transactions)
+        fine_index = build_fine_index(fines)
+
+    for member in batch_members:
+        if not item_pool:
+            break
+
+        # Phase 5: validation before creating checkout
+        if callable(validate_checkout):
+            ok, errors = validate_checkout(
+                member=member,
+                transactions=transactions,
+                fines=fines,
+                membership_limits=MEMBERSHIP_LIMITS,
+                fine_threshold=10.00,
+                loan_index=loan_index,
+                fine_index=fine_index,
+                fast_fail=True,
+            )
+            if not ok:
+                # Skip this member for now; try another iteration
+                # Optionally log errors; keeping output minimal
+                continue
+            member_key = int(member['member_id'])
+            loan_index[member_key] = loan_index.get(member_key, 0) + 1
+
+        # Take an item without replacement: swap the pick with the last slot and pop
+        pick = rng.randrange(len(item_pool))
+        item = available_items[item_pool[pick]]
+        item_pool[pick] = item_pool[-1]
+        item_pool.pop()
+
+        # Set checkout period based on item type (per policy)
+        checkout_days = CHECKOUT_PERIODS.get(item.type, DEFAULT_CHECKOUT_PERIOD)
+        due_str = due_cache.get(checkout_days)
+        if due_str is None:
+            due_str = (checkout_date + timedelta(days=checkout_days)).isoformat()
+            due_cache[checkout_days] = due_str
+
+        checkouts.append({
+            'member_id': member['member_id'],
+            'item_id': item.item_id,
+            'checkout_date': checkout_str,
+            'due_date': due_str,
+            'status': 'active'
+        })
     
     return checkouts
 
 
-def simulate_returns(items):
-    """Simulate return transactions."""
-    checked_out_items = [i for i in items if i['status'] == 'checked_out']
+def simulate_returns(items: List[Any], rng: Optional[random.Random] = None):
+    """Simulate return transactions.
+
+    ``items`` are namedtuple rows from load_csv_rows. ``rng`` is the random
+    source (a fresh ``random.Random()`` if omitted).
+    """
+    if rng is None:
+        rng = random.Random()
+    checked_out_items = [i for i in items if i.status == 'checked_out']
     
+    # All returns in one simulated day share the same date; format it once
+    return_str = date.today().isoformat()
+
     returns = []
-    for _ in range(random.randint(2, 5)):
-        if checked_out_items:
-            item = random.choice(checked_out_items)
-            return_date = datetime.now()
-            
-            # Randomly determine if overdue
-            is_overdue = random.choice([True, False])
-            days_late = random.randint(1, 5) if is_overdue else 0
-            fine = days_late * 0.25
-            
-            returns.append({
-                'item_id': item['item_id'],
-                'return_date': return_date.strftime('%Y-%m-%d'),
-                'days_late': days_late,
-                'fine': fine
-            })
-            
-            checked_out_items.remove(item)
+    n = rng.randint(2, 5)
+    # Distinct items without replacement, drawn in one call
+    item_idxs = rng.sample(range(len(checked_out_items)), k=min(n, len(checked_out_items)))
+    overdue_flags = rng.choices([True, False], k=len(item_idxs))
+
+    for item_idx, is_overdue in zip(item_idxs, overdue_flags):
+        item = checked_out_items[item_idx]
+
+        # Randomly determine if overdue
+        days_late = rng.randint(1, 5) if is_overdue else 0
+        fine = days_late * 0.25
+
+        returns.append({
+            'item_id': item.item_id,
+            'return_date': return_str,
+            'days_late': days_late,
+            'fine': fine
+        })
     
     return returns
 
 
 def main():
     """Main simulation function."""
-    base_path = Path(__file__).parent.parent
-    data_path = base_path / 'data'
-    
-    print(f"Loading data from {data_path}...")
+    print(f"Loading data from {DATA_PATH}...")
     
-    members = load_csv_data(data_path / 'members.csv')
-    items = load_csv_data(data_path / 'items.csv')
+    members = load_csv_data(MEMBERS_CSV)
+    items = load_csv_rows(ITEMS_CSV)
     # Phase 5: load transactions and fines for validation
     transactions = []
     fines = []
-    tx_path = data_path / 'transactions.csv'
-    fines_path = data_path / 'fines.csv'
-    if tx_path.exists():
-        transactions = load_csv_data(tx_path)
-    if fines_path.exists():
-        fines = load_csv_data(fines_path)
+    if TRANSACTIONS_CSV.exists():
+        transactions = load_csv_data(TRANSACTIONS_CSV)
+    if FINES_CSV.exists():
+        fines = load_csv_data(FINES_CSV, schema=FINES_SCHEMA)
+    
+    # One generator per simulated day, seeded by the date, so a day's run is reproducible
+    today = date.today()
+    rng = random.Random(int(today.strftime('%Y%m%d')))
     
-    print(f"\n=== Simulating Library Day ({datetime.now().strftime('%Y-%m-%d')}) ===\n")
+    print(f"\n=== Simulating Library Day ({today.isoformat()}) ===\n")
     
     # Simulate checkouts (with validation if available)
-    checkouts = simulate_checkout(members, items, transactions, fines)
+    checkouts = simulate_checkout(members, items, transactions, fines, rng)
     print(f"Checkouts: {len(checkouts)}")
     for checkout in checkouts:
         print(f"  - Member {checkout['member_id']} checked out item {checkout['item_id']}")
     
     # Simulate returns
-    returns = simulate_returns(items)
+    returns = simulate_returns(items, rng)
     print(f"\nReturns: {len(returns)}")
     for ret in returns:
         fine_msg = f" (Fine: ${ret['fine']:.2f})" if ret['fine'] > 0 else ""
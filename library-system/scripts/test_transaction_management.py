@@ -10,75 +10,121 @@ Tests the add_member() and renew_membership() functions including:
 - Error handling
 """
 
+import atexit
+import csv
+import io
+import os
 import sys
 import shutil
+import stat
 import tempfile
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from calendar import monthrange
+from datetime import date
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+# Add parent directory to path for imports (once, so re-imports by a test
+# runner's workers don't stack duplicate entries)
+SCRIPTS_DIR = str(Path(__file__).resolve().parent)
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
 
 from transaction_management import (
     add_member,
     renew_membership,
+    add_members_bulk,
+    renew_memberships_bulk,
     generate_member_id,
-    load_csv_data,
+    iter_csv_rows,
+    clear_csv_cache,
     write_csv_data,
+    _buffer_size_from_env,
 )
 
 
+def add_months(d, n):
+    """Return date/datetime d shifted by n whole months, clamping to month end.
+
+    Matches the 12-month arithmetic in transaction_management (Feb 29 -> Feb 28).
+    """
+    year, month = divmod(d.month - 1 + n, 12)
+    year += d.year
+    day = min(d.day, monthrange(year, month + 1)[1])
+    return d.replace(year=year, month=month + 1, day=day)
+
+
+def fast_load(path):
+    """Read a CSV file into row dicts using csv.reader and the header row.
+
+    Assertion-time reads only; the code under test keeps using load_csv_data.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.reader(file)
+        header = next(reader)
+        return [dict(zip(header, row)) for row in reader]
+
+
+def by(key, rows):
+    """Index rows by the value of one column for repeated lookups."""
+    return {row[key]: row for row in rows}
+
+
+# Dates the tests compare against, computed once at import. Renewal tests pass
+# _TODAY to renew_membership so both sides agree even across midnight.
+_TODAY = date.today()
+_TODAY_STR = _TODAY.isoformat()
+_PLUS_3MO = add_months(_TODAY, 3).isoformat()
+_PLUS_12MO = add_months(_TODAY, 12).isoformat()
+
+
+# members.csv fixture; member 102's expiry is filled in relative to today
+MEMBERS_CSV_TEMPLATE = """\
+member_id,name,address,email,phone,membership_type,join_date,expiry_date,status
+101,John Smith,123 Main St,john.smith@email.com,555-0101,Standard,2023-01-15,2024-01-15,active
+102,Emily Johnson,456 Oak Ave,emily.j@email.com,555-0102,Premium,2023-03-20,{future_expiry},active
+103,Michael Brown,789 Pine Rd,m.brown@email.com,555-0103,Standard,2022-06-10,2023-06-10,expired
+"""
+
+# (file name, contents) for every fixture file. The data needs no quoting, so
+# each file is one preformatted block of bytes rather than csv output.
+# Note: Member 102 has future expiry to test non-expired renewal logic
+FIXTURE_FILES = (
+    ('members.csv', MEMBERS_CSV_TEMPLATE.format(future_expiry=_PLUS_3MO).encode('utf-8')),
+)
+
+# All tests share one temporary directory; fixtures are restored from the
+# cached bytes before each test and the directory is removed once at exit
+_TEST_DIR = None
+
+# Prefer RAM-backed /dev/shm (Linux) for the test directory; None means the
+# platform's default temp location
+_TMP_PARENT = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+
+def write_fixture_files(temp_dir):
+    """Write the preformatted FIXTURE_FILES bytes into temp_dir."""
+    for name, blob in FIXTURE_FILES:
+        fd = os.open(temp_dir / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, blob)
+        finally:
+            os.close(fd)
+
+
 def setup_test_data_dir():
-    """Create a temporary directory with test data."""
-    temp_dir = Path(tempfile.mkdtemp())
-    
-    # Create a test members.csv file
-    # Note: Member 102 has future expiry to test non-expired renewal logic
-    future_expiry = (datetime.now() + relativedelta(months=3)).strftime('%Y-%m-%d')
-    
-    test_members = [
-        {
-            'member_id': '101',
-            'name': 'John Smith',
-            'address': '123 Main St',
-            'email': 'john.smith@email.com',
-            'phone': '555-0101',
-            'membership_type': 'Standard',
-            'join_date': '2023-01-15',
-            'expiry_date': '2024-01-15',
-            'status': 'active'
-        },
-        {
-            'member_id': '102',
-            'name': 'Emily Johnson',
-            'address': '456 Oak Ave',
-            'email': 'emily.j@email.com',
-            'phone': '555-0102',
-            'membership_type': 'Premium',
-            'join_date': '2023-03-20',
-            'expiry_date': future_expiry,  # Future date to test non-expired renewal
-            'status': 'active'
-        },
-        {
-            'member_id': '103',
-            'name': 'Michael Brown',
-            'address': '789 Pine Rd',
-            'email': 'm.brown@email.com',
-            'phone': '555-0103',
-            'membership_type': 'Standard',
-            'join_date': '2022-06-10',
-            'expiry_date': '2023-06-10',
-            'status': 'expired'
-        }
-    ]
-    
-    members_file = temp_dir / 'members.csv'
-    fieldnames = ['member_id', 'name', 'address', 'email', 'phone', 
-                  'membership_type', 'join_date', 'expiry_date', 'status']
-    write_csv_data(members_file, test_members, fieldnames)
-    
-    return temp_dir
+    """Return the shared test data directory with fixtures freshly restored.
+
+    The fixture bytes are rendered once at import and written back over any
+    files a previous test changed, so no directory is created per test. The
+    module's CSV cache is cleared because a restore can land in the same
+    timestamp tick as the previous test's write.
+    """
+    global _TEST_DIR
+    if _TEST_DIR is None:
+        _TEST_DIR = Path(tempfile.mkdtemp(dir=_TMP_PARENT))
+        atexit.register(cleanup_test_data_dir, _TEST_DIR)
+    write_fixture_files(_TEST_DIR)
+    clear_csv_cache()
+    return _TEST_DIR
 
 
 def cleanup_test_data_dir(temp_dir):
@@ -100,369 +146,565 @@ def test_generate_member_id():
     ]
     assert generate_member_id(members) == 106
     
-    print("✓ test_generate_member_id passed")
+    # Streamed rows work the same as a list
+    temp_dir = setup_test_data_dir()
+    assert generate_member_id(iter_csv_rows(temp_dir / 'members.csv')) == 104
+
+
+# Fields written for the member added in test_add_member_success
+EXPECTED_ALICE = {
+    'member_id': '104',
+    'name': 'Alice Williams',
+    'email': 'alice@test.com',
+    'membership_type': 'Student',
+    'status': 'active',
+    'join_date': '2024-11-05',
+    'expiry_date': '2025-11-05',
+}
 
 
 def test_add_member_success():
     """Test successfully adding a new member."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        success, message, member_id = add_member(
-            name='Alice Williams',
-            address='999 Test St',
-            email='alice@test.com',
-            phone='555-9999',
-            membership_type='Student',
-            join_date='2024-11-05',
-            data_dir=temp_dir
-        )
-        
-        assert success, f"Expected success but got: {message}"
-        assert member_id == 104, f"Expected member_id 104 but got {member_id}"
-        assert 'successfully' in message.lower()
-        
-        # Verify the member was added to the file
-        members = load_csv_data(temp_dir / 'members.csv')
-        assert len(members) == 4
-        
-        new_member = members[-1]
-        assert new_member['member_id'] == '104'
-        assert new_member['name'] == 'Alice Williams'
-        assert new_member['email'] == 'alice@test.com'
-        assert new_member['membership_type'] == 'Student'
-        assert new_member['status'] == 'active'
-        assert new_member['join_date'] == '2024-11-05'
-        assert new_member['expiry_date'] == '2025-11-05'
-        
-        print("✓ test_add_member_success passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    success, message, member_id = add_member(
+        name='Alice Williams',
+        address='999 Test St',
+        email='alice@test.com',
+        phone='555-9999',
+        membership_type='Student',
+        join_date='2024-11-05',
+        data_dir=temp_dir
+    )
+    
+    assert success, f"Expected success but got: {message}"
+    assert member_id == 104, f"Expected member_id 104 but got {member_id}"
+    assert 'successfully' in message.lower()
+    
+    # Verify the member was added to the file
+    members = fast_load(temp_dir / 'members.csv')
+    assert len(members) == 4
+    
+    new_member = members[-1]
+    assert {k: new_member[k] for k in EXPECTED_ALICE} == EXPECTED_ALICE
 
 
 def test_add_member_default_join_date():
     """Test adding a member with default join date (today)."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        today = datetime.now().strftime('%Y-%m-%d')
-        one_year = (datetime.now() + relativedelta(months=12)).strftime('%Y-%m-%d')
-        
-        success, message, member_id = add_member(
-            name='Bob Test',
-            address='888 Test Ave',
-            email='bob@test.com',
-            phone='555-8888',
-            membership_type='Standard',
-            data_dir=temp_dir
-        )
-        
-        assert success
-        
-        members = load_csv_data(temp_dir / 'members.csv')
-        new_member = members[-1]
-        assert new_member['join_date'] == today
-        assert new_member['expiry_date'] == one_year
-        
-        print("✓ test_add_member_default_join_date passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    success, message, member_id = add_member(
+        name='Bob Test',
+        address='888 Test Ave',
+        email='bob@test.com',
+        phone='555-8888',
+        membership_type='Standard',
+        data_dir=temp_dir
+    )
+    
+    assert success
+    
+    members = fast_load(temp_dir / 'members.csv')
+    new_member = members[-1]
+    assert new_member['join_date'] == _TODAY_STR
+    assert new_member['expiry_date'] == _PLUS_12MO
+
+
+# Valid add_member() arguments; rejection tests override one field each
+VALID_MEMBER_ARGS = {
+    'name': 'Test User',
+    'address': '123 Test St',
+    'email': 'test@test.com',
+    'phone': '555-1234',
+    'membership_type': 'Standard',
+}
+
+def assert_add_member_rejected(overrides, *needles):
+    """Call add_member() with one invalid field and check the error message."""
+    temp_dir = setup_test_data_dir()
+    
+    success, message, member_id = add_member(
+        **{**VALID_MEMBER_ARGS, **overrides}, data_dir=temp_dir
+    )
+    
+    assert not success, f"Expected failure for {overrides} but got: {message}"
+    message_lower = message.lower()
+    for needle in needles:
+        assert needle in message_lower, f"Expected '{needle}' in: {message}"
+    assert member_id is None
 
 
 def test_add_member_missing_name():
     """Test that adding a member without a name fails."""
-    temp_dir = setup_test_data_dir()
-    
-    try:
-        success, message, member_id = add_member(
-            name='',
-            address='123 Test St',
-            email='test@test.com',
-            phone='555-1234',
-            membership_type='Standard',
-            data_dir=temp_dir
-        )
-        
-        assert not success
-        assert 'name' in message.lower()
-        assert member_id is None
-        
-        print("✓ test_add_member_missing_name passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    assert_add_member_rejected({'name': ''}, 'name')
 
 
 def test_add_member_missing_email():
     """Test that adding a member without email fails."""
-    temp_dir = setup_test_data_dir()
-    
-    try:
-        success, message, member_id = add_member(
-            name='Test User',
-            address='123 Test St',
-            email='',
-            phone='555-1234',
-            membership_type='Standard',
-            data_dir=temp_dir
-        )
-        
-        assert not success
-        assert 'email' in message.lower()
-        assert member_id is None
-        
-        print("✓ test_add_member_missing_email passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    assert_add_member_rejected({'email': ''}, 'email')
 
 
 def test_add_member_invalid_membership_type():
     """Test that adding a member with invalid membership type fails."""
-    temp_dir = setup_test_data_dir()
-    
-    try:
-        success, message, member_id = add_member(
-            name='Test User',
-            address='123 Test St',
-            email='test@test.com',
-            phone='555-1234',
-            membership_type='InvalidType',
-            data_dir=temp_dir
-        )
-        
-        assert not success
-        assert 'invalid membership type' in message.lower()
-        assert member_id is None
-        
-        print("✓ test_add_member_invalid_membership_type passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    assert_add_member_rejected({'membership_type': 'InvalidType'}, 'invalid membership type')
 
 
 def test_add_member_invalid_date_format():
     """Test that adding a member with invalid date format fails."""
+    assert_add_member_rejected({'join_date': '2024/11/05'}, 'invalid', 'date')  # Wrong format
+
+
+def test_add_member_leap_day_join_date():
+    """Test that a Feb 29 join date expires on Feb 28 of the next year."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        success, message, member_id = add_member(
-            name='Test User',
-            address='123 Test St',
-            email='test@test.com',
-            phone='555-1234',
-            membership_type='Standard',
-            join_date='2024/11/05',  # Wrong format
-            data_dir=temp_dir
-        )
-        
-        assert not success
-        assert 'invalid' in message.lower() and 'date' in message.lower()
-        assert member_id is None
-        
-        print("✓ test_add_member_invalid_date_format passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    success, message, member_id = add_member(
+        **VALID_MEMBER_ARGS, join_date='2024-02-29', data_dir=temp_dir
+    )
+    
+    assert success, f"Expected success but got: {message}"
+    new_member = by('member_id', fast_load(temp_dir / 'members.csv'))[str(member_id)]
+    assert new_member['expiry_date'] == '2025-02-28'
+
+
+def test_add_member_appends_row():
+    """Test that add_member appends one row and leaves existing bytes alone."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    
+    # Drop the final newline to check the appended row starts on its own line
+    original = members_file.read_bytes().rstrip(b'\n')
+    members_file.write_bytes(original)
+    
+    success, message, member_id = add_member(**VALID_MEMBER_ARGS, data_dir=temp_dir)
+    
+    assert success, f"Expected success but got: {message}"
+    # The fixture uses '\n' line endings, and the appended row must match them
+    content = members_file.read_bytes()
+    assert content.startswith(original + b'\n')
+    assert content.endswith(b'\n') and b'\r' not in content
+    members = fast_load(members_file)
+    assert len(members) == 4
+    assert members[-1]['member_id'] == str(member_id)
+
+
+def test_add_member_keeps_crlf_line_endings():
+    """Test that appending to a CRLF file keeps CRLF line endings."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    original = members_file.read_bytes().replace(b'\n', b'\r\n')
+    members_file.write_bytes(original)
+    
+    success, message, _ = add_member(**VALID_MEMBER_ARGS, data_dir=temp_dir)
+    
+    assert success, f"Expected success but got: {message}"
+    content = members_file.read_bytes()
+    assert content.startswith(original) and content.endswith(b'\r\n')
+    assert content.count(b'\n') == content.count(b'\r\n')
 
 
 def test_renew_membership_success():
     """Test successfully renewing a non-expired membership (extends from current expiry)."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        # Member 102 has future expiry date (not expired)
-        # Per workflow spec: if not expired, extend from current expiry
-        
-        # Get the current expiry date for member 102
-        members_before = load_csv_data(temp_dir / 'members.csv')
-        member_102_before = next(m for m in members_before if m['member_id'] == '102')
-        current_expiry = datetime.strptime(member_102_before['expiry_date'], '%Y-%m-%d').date()
-        expected_new_expiry = (datetime.combine(current_expiry, datetime.min.time()) + relativedelta(months=12)).strftime('%Y-%m-%d')
-        
-        # Renew member 102
-        success, message = renew_membership(102, data_dir=temp_dir)
-        
-        assert success
-        assert 'successfully' in message.lower()
-        assert expected_new_expiry in message
-        
-        # Verify the expiry date was extended from current expiry (not from today)
-        members = load_csv_data(temp_dir / 'members.csv')
-        member = next(m for m in members if m['member_id'] == '102')
-        assert member['expiry_date'] == expected_new_expiry
-        assert member['status'] == 'active'
-        
-        print("✓ test_renew_membership_success passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    # Member 102 has future expiry date (not expired)
+    # Per workflow spec: if not expired, extend from current expiry
+    
+    # Current expiry for member 102 comes straight from the fixture
+    current_expiry = date.fromisoformat(_PLUS_3MO)
+    expected_new_expiry = add_months(current_expiry, 12)
+    
+    # Renew member 102
+    success, message = renew_membership(102, data_dir=temp_dir, today=_TODAY)
+    
+    assert success
+    assert 'successfully' in message.lower()
+    assert expected_new_expiry.isoformat() in message
+    
+    # Verify the expiry date was extended from current expiry (not from today)
+    members_by_id = by('member_id', fast_load(temp_dir / 'members.csv'))
+    member = members_by_id['102']
+    assert date.fromisoformat(member['expiry_date']) == expected_new_expiry
+    assert member['status'] == 'active'
+    assert members_by_id['103']['status'] == 'expired'  # Other members untouched
+
+
+def test_renew_membership_patches_active_row_in_place():
+    """Test that renewing an active member changes only its expiry_date bytes."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    original = members_file.read_bytes()
+    inode = members_file.stat().st_ino
+    
+    success, message = renew_membership(102, data_dir=temp_dir, today=_TODAY)
+    assert success, f"Expected success but got: {message}"
+    
+    new_expiry = add_months(date.fromisoformat(_PLUS_3MO), 12).isoformat()
+    assert members_file.stat().st_ino == inode
+    assert members_file.read_bytes() == original.replace(
+        f',{_PLUS_3MO},active'.encode(), f',{new_expiry},active'.encode()
+    )
 
 
 def test_renew_membership_expired_member():
     """Test renewing an expired membership extends from today per workflow spec."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        # Member 103 is expired (expiry_date: 2023-06-10)
-        # Per workflow spec: if expired, extend from today (not from old expiry)
-        success, message = renew_membership(103, data_dir=temp_dir)
-        
-        assert success
-        
-        # Calculate expected expiry (today + 12 months)
-        expected_expiry = (datetime.now() + relativedelta(months=12)).strftime('%Y-%m-%d')
-        
-        # Verify the expiry date was extended from today and status changed to active
-        members = load_csv_data(temp_dir / 'members.csv')
-        member = next(m for m in members if m['member_id'] == '103')
-        assert member['expiry_date'] == expected_expiry  # Should be today + 12 months
-        assert member['status'] == 'active'  # Should be updated from 'expired'
-        
-        print("✓ test_renew_membership_expired_member passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    # Member 103 is expired (expiry_date: 2023-06-10)
+    # Per workflow spec: if expired, extend from today (not from old expiry)
+    success, message = renew_membership(103, data_dir=temp_dir, today=_TODAY)
+    
+    assert success
+    
+    # Verify the expiry date was extended from today and status changed to active
+    members_by_id = by('member_id', fast_load(temp_dir / 'members.csv'))
+    member = members_by_id['103']
+    assert date.fromisoformat(member['expiry_date']) == add_months(_TODAY, 12)  # Should be today + 12 months
+    assert member['status'] == 'active'  # Should be updated from 'expired'
+    assert members_by_id['102']['expiry_date'] == _PLUS_3MO  # Other members untouched
 
 
 def test_renew_membership_nonexistent_member():
     """Test that renewing a non-existent member fails."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        success, message = renew_membership(999, data_dir=temp_dir)
-        
-        assert not success
-        assert 'not found' in message.lower()
-        
-        print("✓ test_renew_membership_nonexistent_member passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    success, message = renew_membership(999, data_dir=temp_dir)
+    
+    assert not success
+    assert 'not found' in message.lower()
+
+
+def test_renew_membership_sees_external_edit():
+    """Test that cached members.csv contents are refreshed when the file changes."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    
+    success, message = renew_membership(102, data_dir=temp_dir, today=_TODAY)
+    assert success, f"Expected success but got: {message}"
+    
+    # Another writer appends a member this module has not seen
+    with open(members_file, 'a', encoding='utf-8', newline='') as file:
+        file.write('104,Late Joiner,1 Side St,late@test.com,555-0104,Child,2022-01-01,2023-01-01,expired\n')
+    
+    success, message = renew_membership(104, data_dir=temp_dir, today=_TODAY)
+    assert success, f"Expected success but got: {message}"
+    
+    members_by_id = by('member_id', fast_load(members_file))
+    assert members_by_id['104']['expiry_date'] == _PLUS_12MO
+    assert members_by_id['102']['expiry_date'] == add_months(date.fromisoformat(_PLUS_3MO), 12).isoformat()
+
+
+def test_renew_membership_skips_malformed_member_id():
+    """Test that a row with a non-numeric member_id does not block other renewals."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    with open(members_file, 'a', encoding='utf-8', newline='') as file:
+        file.write('abc,Bad Row,1 Side St,bad@test.com,555-0000,Adult,2022-01-01,2023-01-01,expired\n')
+    
+    success, message = renew_membership(102, data_dir=temp_dir, today=_TODAY)
+    assert success, f"Expected success but got: {message}"
+    
+    success, message = renew_memberships_bulk([101, 103], data_dir=temp_dir, today=_TODAY)
+    assert success, f"Expected success but got: {message}"
+    
+    members_by_id = by('member_id', fast_load(members_file))
+    assert members_by_id['102']['expiry_date'] == add_months(date.fromisoformat(_PLUS_3MO), 12).isoformat()
+    assert members_by_id['abc']['expiry_date'] == '2023-01-01'  # Left as it was
+
+
+def test_missing_members_file():
+    """Test that member operations report a missing members.csv and leave no lock file."""
+    temp_dir = setup_test_data_dir() / 'empty'
+    temp_dir.mkdir(exist_ok=True)
+    
+    success, message, member_id = add_member(**VALID_MEMBER_ARGS, data_dir=temp_dir)
+    assert not success and member_id is None
+    assert 'members file not found' in message.lower()
+    
+    success, message = renew_membership(101, data_dir=temp_dir)
+    assert not success
+    assert 'members file not found' in message.lower()
+    
+    success, message = renew_memberships_bulk([101], data_dir=temp_dir)
+    assert not success
+    assert 'members file not found' in message.lower()
+    
+    # Failed calls must not leave a lock file behind
+    assert list(temp_dir.iterdir()) == []
 
 
 def test_multiple_add_member_unique_ids():
     """Test that adding multiple members generates unique IDs."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        # Add first member
-        success1, msg1, id1 = add_member(
-            name='User One',
-            address='111 Test St',
-            email='user1@test.com',
-            phone='555-1111',
-            membership_type='Standard',
-            data_dir=temp_dir
-        )
-        
-        # Add second member
-        success2, msg2, id2 = add_member(
-            name='User Two',
-            address='222 Test St',
-            email='user2@test.com',
-            phone='555-2222',
-            membership_type='Premium',
-            data_dir=temp_dir
-        )
-        
-        assert success1 == True
-        assert success2 == True
-        assert id1 == 104
-        assert id2 == 105
-        assert id1 != id2
-        
-        # Verify both members were added
-        members = load_csv_data(temp_dir / 'members.csv')
-        assert len(members) == 5
-        
-        print("✓ test_multiple_add_member_unique_ids passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    # Add first member
+    success1, msg1, id1 = add_member(
+        name='User One',
+        address='111 Test St',
+        email='user1@test.com',
+        phone='555-1111',
+        membership_type='Standard',
+        data_dir=temp_dir
+    )
+    
+    # Add second member
+    success2, msg2, id2 = add_member(
+        name='User Two',
+        address='222 Test St',
+        email='user2@test.com',
+        phone='555-2222',
+        membership_type='Premium',
+        data_dir=temp_dir
+    )
+    
+    assert success1 == True
+    assert success2 == True
+    assert id1 == 104
+    assert id2 == 105
+    assert id1 != id2
+    
+    # Verify both members were added
+    members = fast_load(temp_dir / 'members.csv')
+    assert len(members) == 5
+    members_by_id = by('member_id', members)
+    assert members_by_id['104']['name'] == 'User One'
+    assert members_by_id['105']['name'] == 'User Two'
 
 
 def test_add_member_duplicate_email():
     """Test that adding a member with duplicate email fails."""
     temp_dir = setup_test_data_dir()
     
-    try:
-        # Try to add a member with the same email as member 101
-        success, message, member_id = add_member(
-            name='New User',
-            address='999 New St',
-            email='john.smith@email.com',  # Same as member 101
-            phone='555-9999',
-            membership_type='Standard',
-            data_dir=temp_dir
-        )
-        
-        assert not success
-        assert 'email already registered' in message.lower()
-        assert member_id is None
-        
-        print("✓ test_add_member_duplicate_email passed")
-    finally:
-        cleanup_test_data_dir(temp_dir)
+    # Try to add a member with the same email as member 101
+    success, message, member_id = add_member(
+        name='New User',
+        address='999 New St',
+        email='john.smith@email.com',  # Same as member 101
+        phone='555-9999',
+        membership_type='Standard',
+        data_dir=temp_dir
+    )
+    
+    assert not success
+    assert 'email already registered' in message.lower()
+    assert member_id is None
 
 
 def test_add_member_duplicate_email_case_insensitive():
     """Test that email uniqueness check is case-insensitive."""
     temp_dir = setup_test_data_dir()
     
+    # Try to add a member with the same email but different case
+    success, message, member_id = add_member(
+        name='New User',
+        address='999 New St',
+        email='JOHN.SMITH@EMAIL.COM',  # Same as member 101 but uppercase
+        phone='555-9999',
+        membership_type='Standard',
+        data_dir=temp_dir
+    )
+    
+    assert not success
+    assert 'email already registered' in message.lower()
+    assert member_id is None
+
+
+def test_add_members_bulk():
+    """Test adding several members in one call assigns consecutive IDs."""
+    temp_dir = setup_test_data_dir()
+    
+    success, message, member_ids = add_members_bulk([
+        dict(VALID_MEMBER_ARGS, name='Bulk One', email='bulk1@test.com'),
+        dict(VALID_MEMBER_ARGS, name='Bulk Two', email='bulk2@test.com', join_date='2024-11-05'),
+    ], data_dir=temp_dir)
+    
+    assert success, f"Expected success but got: {message}"
+    assert member_ids == [104, 105]
+    
+    members_by_id = by('member_id', fast_load(temp_dir / 'members.csv'))
+    assert len(members_by_id) == 5
+    assert members_by_id['104']['name'] == 'Bulk One'
+    assert members_by_id['105']['expiry_date'] == '2025-11-05'
+
+
+def test_add_members_bulk_all_or_nothing():
+    """Test that one invalid record rejects the whole batch."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    original = members_file.read_bytes()
+    
+    # Second record repeats the first record's email
+    success, message, member_ids = add_members_bulk([
+        dict(VALID_MEMBER_ARGS, email='same@test.com'),
+        dict(VALID_MEMBER_ARGS, email='SAME@test.com'),
+    ], data_dir=temp_dir)
+    
+    assert not success
+    assert 'record 1' in message.lower() and 'email already registered' in message.lower()
+    assert member_ids == []
+    assert members_file.read_bytes() == original
+    
+    # The rejected batch must not leave its emails marked as taken
+    success, message, member_id = add_member(**dict(VALID_MEMBER_ARGS, email='same@test.com'), data_dir=temp_dir)
+    assert success, f"Expected success but got: {message}"
+
+
+def test_renew_memberships_bulk():
+    """Test renewing several members in one call, and that a bad ID rejects the batch."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    original = members_file.read_bytes()
+    
+    success, message = renew_memberships_bulk([102, 999], data_dir=temp_dir, today=_TODAY)
+    assert not success
+    assert 'not found' in message.lower()
+    assert members_file.read_bytes() == original
+    
+    success, message = renew_memberships_bulk([102, 103], data_dir=temp_dir, today=_TODAY)
+    assert success, f"Expected success but got: {message}"
+    
+    members_by_id = by('member_id', fast_load(members_file))
+    assert members_by_id['102']['expiry_date'] == add_months(date.fromisoformat(_PLUS_3MO), 12).isoformat()
+    assert members_by_id['103']['expiry_date'] == _PLUS_12MO
+    assert members_by_id['103']['status'] == 'active'
+    assert members_by_id['101']['expiry_date'] == '2024-01-15'  # Not in the batch
+
+
+def test_write_csv_data_failure_keeps_file():
+    """Test that a failed rewrite leaves members.csv intact and no temp files behind."""
+    temp_dir = setup_test_data_dir()
+    members_file = temp_dir / 'members.csv'
+    original = members_file.read_bytes()
+    
+    # DictWriter rejects a row with a column missing from fieldnames mid-write
+    rows = fast_load(members_file) + [{'member_id': '999', 'unexpected': 'x'}]
     try:
-        # Try to add a member with the same email but different case
-        success, message, member_id = add_member(
-            name='New User',
-            address='999 New St',
-            email='JOHN.SMITH@EMAIL.COM',  # Same as member 101 but uppercase
-            phone='555-9999',
-            membership_type='Standard',
-            data_dir=temp_dir
-        )
-        
-        assert not success
-        assert 'email already registered' in message.lower()
-        assert member_id is None
-        
-        print("✓ test_add_member_duplicate_email_case_insensitive passed")
+        write_csv_data(members_file, rows, list(rows[0]))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for unknown column")
+    
+    assert members_file.read_bytes() == original
+    assert [p.name for p in temp_dir.iterdir() if p.suffix == '.tmp'] == []
+
+
+def test_write_csv_data_generic_rows():
+    """Test that non-member files are written exactly as csv.DictWriter would."""
+    temp_dir = setup_test_data_dir()
+    target = temp_dir / 'events.csv'
+    fieldnames = ['event_id', 'title', 'notes']
+    rows = [
+        {'event_id': '1', 'title': 'Story Time', 'notes': 'Ages 3-5, "bring a mat"'},
+        {'event_id': '2', 'title': 'Book Club', 'notes': None},
+        {'event_id': '3', 'title': 'Chess'},  # Missing field, padded by DictWriter
+    ]
+    
+    write_csv_data(target, rows, fieldnames)
+    
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+    assert target.read_bytes().decode('utf-8') == buffer.getvalue()
+
+
+def test_write_csv_data_new_file_mode():
+    """Test that a newly created file gets the umask-derived mode, not mkstemp's 0600."""
+    if os.name != 'posix':
+        return  # Windows only tracks the read-only bit
+    temp_dir = setup_test_data_dir()
+    target = temp_dir / 'new.csv'
+    mask = os.umask(0o022)
+    try:
+        write_csv_data(target, [{'id': '1'}], ['id'])
     finally:
-        cleanup_test_data_dir(temp_dir)
+        os.umask(mask)
+    
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644, oct(target.stat().st_mode)
+
+
+def test_buffer_size_env_fallback():
+    """Test that an invalid LIBRARY_CSV_BUFFER_SIZE falls back to 1 MiB."""
+    saved = os.environ.get('LIBRARY_CSV_BUFFER_SIZE')
+    try:
+        for value, expected in (('4096', 4096), ('abc', 1 << 20), ('0', 1 << 20), ('-1', 1 << 20)):
+            os.environ['LIBRARY_CSV_BUFFER_SIZE'] = value
+            assert _buffer_size_from_env() == expected, f"{value!r} gave {_buffer_size_from_env()}"
+    finally:
+        if saved is None:
+            os.environ.pop('LIBRARY_CSV_BUFFER_SIZE', None)
+        else:
+            os.environ['LIBRARY_CSV_BUFFER_SIZE'] = saved
+
+
+# Tests in run order, with names resolved once for reporting
+_TESTS = (
+    test_generate_member_id,
+    test_add_member_success,
+    test_add_member_leap_day_join_date,
+    test_add_member_appends_row,
+    test_add_member_keeps_crlf_line_endings,
+    test_add_member_default_join_date,
+    test_add_member_missing_name,
+    test_add_member_missing_email,
+    test_add_member_invalid_membership_type,
+    test_add_member_invalid_date_format,
+    test_add_member_duplicate_email,
+    test_add_member_duplicate_email_case_insensitive,
+    test_renew_membership_success,
+    test_renew_membership_patches_active_row_in_place,
+    test_renew_membership_expired_member,
+    test_renew_membership_nonexistent_member,
+    test_renew_membership_sees_external_edit,
+    test_renew_membership_skips_malformed_member_id,
+    test_missing_members_file,
+    test_multiple_add_member_unique_ids,
+    test_add_members_bulk,
+    test_add_members_bulk_all_or_nothing,
+    test_renew_memberships_bulk,
+    test_write_csv_data_failure_keeps_file,
+    test_write_csv_data_generic_rows,
+    test_write_csv_data_new_file_mode,
+    test_buffer_size_env_fallback,
+)
+_TEST_NAMES = tuple(t.__name__ for t in _TESTS)
 
 
 def run_all_tests():
-    """Run all tests."""
-    print("=" * 60)
-    print("Running Phase 6 Transaction Management Tests")
-    print("=" * 60)
-    print()
-    
-    tests = [
-        test_generate_member_id,
-        test_add_member_success,
-        test_add_member_default_join_date,
-        test_add_member_missing_name,
-        test_add_member_missing_email,
-        test_add_member_invalid_membership_type,
-        test_add_member_invalid_date_format,
-        test_add_member_duplicate_email,
-        test_add_member_duplicate_email_case_insensitive,
-        test_renew_membership_success,
-        test_renew_membership_expired_member,
-        test_renew_membership_nonexistent_member,
-        test_multiple_add_member_unique_ids,
+    """Run all tests.
+
+    Results are collected and written to stdout in one call at the end.
+    """
+    lines = [
+        "=" * 60,
+        "Running Phase 6 Transaction Management Tests",
+        "=" * 60,
+        "",
     ]
     
     passed = 0
     failed = 0
     
-    for test in tests:
+    for test, name in zip(_TESTS, _TEST_NAMES):
         try:
             test()
+            lines.append(f"✓ {name} passed")
             passed += 1
         except AssertionError as e:
-            print(f"✗ {test.__name__} failed: {e}")
+            lines.append(f"✗ {name} failed: {e}")
             failed += 1
         except Exception as e:
-            print(f"✗ {test.__name__} error: {e}")
+            lines.append(f"✗ {name} error: {e}")
             failed += 1
     
-    print()
-    print("=" * 60)
-    print(f"Test Results: {passed} passed, {failed} failed")
-    print("=" * 60)
+    lines += [
+        "",
+        "=" * 60,
+        f"Test Results: {passed} passed, {failed} failed",
+        "=" * 60,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
     
     return failed == 0
 
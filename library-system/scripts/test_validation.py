@@ -11,7 +11,7 @@ Tests all validation functions including:
 """
 
 import sys
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -19,7 +19,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from validation import (
     validate_checkout,
+    build_loan_index,
+    build_fine_index,
     detect_event_conflicts,
+    build_event_index,
+    build_room_index,
     validate_room_capacity,
     validate_advance_notice,
     validate_operating_hours,
@@ -31,6 +35,12 @@ from validation import (
 )
 
 
+# Event dates relative to today, computed once for the whole run
+_TODAY = date.today()
+_IN_1_DAY = (_TODAY + timedelta(days=1)).isoformat()
+_IN_5_DAYS = (_TODAY + timedelta(days=5)).isoformat()
+
+
 def test_count_active_loans():
     """Test counting active loans for a member."""
     transactions = [
@@ -61,6 +71,33 @@ def test_sum_outstanding_fines():
     print("✓ test_sum_outstanding_fines passed")
 
 
+def test_build_loan_and_fine_index():
+    """Test that the per-member indexes match the linear counts."""
+    transactions = [
+        {"member_id": "101", "item_id": "1", "return_date": ""},
+        {"member_id": "101", "item_id": "2", "return_date": "2024-01-15"},  # returned
+        {"member_id": "102", "item_id": "3", "return_date": ""},
+        {"member_id": "bad", "item_id": "4", "return_date": ""},  # malformed
+    ]
+    fines = [
+        {"member_id": "101", "amount": "5.25", "status": "unpaid", "paid_date": ""},
+        {"member_id": "101", "amount": "2.10", "status": "unpaid", "paid_date": ""},
+        {"member_id": "101", "amount": "9.00", "status": "paid", "paid_date": "2024-01-20"},
+        {"member_id": "102", "amount": "oops", "status": "unpaid", "paid_date": ""},  # malformed
+    ]
+    
+    loan_index = build_loan_index(transactions)
+    fine_index = build_fine_index(fines)
+    for member_id in (101, 102, 103):
+        assert loan_index.get(member_id, 0) == count_active_loans(transactions, member_id)
+        assert round(fine_index.get(member_id, 0.0), 2) == sum_outstanding_fines(fines, member_id)
+    
+    member = {"member_id": "101", "membership_type": "Child"}
+    assert validate_checkout(member, transactions, fines, loan_index=loan_index, fine_index=fine_index) == \
+        validate_checkout(member, transactions, fines)
+    print("✓ test_build_loan_and_fine_index passed")
+
+
 def test_validate_checkout_item_limit():
     """Test checkout validation for item limits."""
     member = {"member_id": "101", "membership_type": "Standard"}
@@ -107,6 +144,26 @@ def test_validate_checkout_fine_threshold():
     print("✓ test_validate_checkout_fine_threshold passed")
 
 
+def test_validate_checkout_fast_fail():
+    """Test that fast_fail reports only the fine failure and skips the loan count."""
+    member = {"member_id": "101", "membership_type": "Child"}
+    transactions = [{"member_id": "101", "return_date": ""}] * 3  # At the Child limit
+    fines = [{"member_id": "101", "amount": "12.00", "status": "unpaid", "paid_date": ""}]
+    
+    ok, errors = validate_checkout(member, transactions, fines)
+    assert ok == False and len(errors) == 2
+    assert "Item limit exceeded" in errors[0]
+    
+    # transactions=None would fail if the loans were counted
+    ok, errors = validate_checkout(member, None, fines, fast_fail=True)
+    assert ok == False
+    assert len(errors) == 1 and "Outstanding fines" in errors[0]
+    
+    ok, errors = validate_checkout(member, transactions, [], fast_fail=True)
+    assert ok == False and "Item limit exceeded" in errors[0]
+    print("✓ test_validate_checkout_fast_fail passed")
+
+
 def test_detect_event_conflicts_no_conflict():
     """Test event conflict detection when no conflicts exist."""
     new_event = {
@@ -190,6 +247,56 @@ def test_detect_event_conflicts_edge_cases():
     print("✓ test_detect_event_conflicts_edge_cases passed")
 
 
+def test_detect_event_conflicts_indexed():
+    """Test conflict detection against a prebuilt event index."""
+    existing_events = [
+        {
+            "event_id": "301",
+            "event_date": "2024-01-20",
+            "start_time": "09:00",
+            "end_time": "15:00",
+            "room_id": "R101"  # Long event overlapping later bookings
+        },
+        {
+            "event_id": "302",
+            "event_date": "2024-01-20",
+            "start_time": "11:00",
+            "end_time": "12:00",
+            "room_id": "R101"
+        },
+        {
+            "event_id": "303",
+            "event_date": "2024-01-20",
+            "start_time": "16:00",
+            "end_time": "17:00",
+            "room_id": "R102"
+        },
+    ]
+    index = build_event_index(existing_events)
+    
+    # Overlaps only the long event 301, which starts well before it
+    new_event = {
+        "event_date": "2024-01-20",
+        "start_time": "13:00",
+        "end_time": "14:00",
+        "room_id": "R101"
+    }
+    ok, msg = detect_event_conflicts(new_event, existing_events, index)
+    assert ok == False
+    assert "301" in msg
+    
+    # Adjacent to 301 - no conflict
+    new_event["start_time"], new_event["end_time"] = "15:00", "16:00"
+    ok, msg = detect_event_conflicts(new_event, existing_events, index)
+    assert ok == True, f"Adjacent events should not conflict: {msg}"
+    
+    # Same time as 303 but in a room with no other bookings that day
+    new_event["room_id"] = "R103"
+    ok, msg = detect_event_conflicts(new_event, existing_events, index)
+    assert ok == True, f"Expected no conflict but got: {msg}"
+    print("✓ test_detect_event_conflicts_indexed passed")
+
+
 def test_validate_room_capacity_pass():
     """Test room capacity validation when capacity is sufficient."""
     event = {"expected_attendance": "25"}
@@ -213,7 +320,7 @@ def test_validate_room_capacity_fail():
 
 def test_validate_advance_notice_pass():
     """Test advance notice validation with sufficient notice."""
-    event_date = (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d")
+    event_date = _IN_5_DAYS
     
     ok, msg = validate_advance_notice(event_date)
     assert ok == True
@@ -222,7 +329,7 @@ def test_validate_advance_notice_pass():
 
 def test_validate_advance_notice_fail():
     """Test advance notice validation with insufficient notice."""
-    event_date = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    event_date = _IN_1_DAY
     
     ok, msg = validate_advance_notice(event_date)
     assert ok == False
@@ -230,6 +337,25 @@ def test_validate_advance_notice_fail():
     print("✓ test_validate_advance_notice_fail passed")
 
 
+def test_validate_advance_notice_booking_date():
+    """Test advance notice counts whole calendar days from an explicit booking date."""
+    ok, msg = validate_advance_notice("2024-01-10", booking_date="2024-01-07")
+    assert ok == True, msg
+    
+    ok, msg = validate_advance_notice("2024-01-09", booking_date="2024-01-07")
+    assert ok == False
+    assert "event is in 2 days" in msg
+    
+    # Month boundary
+    ok, msg = validate_advance_notice("2024-03-02", booking_date="2024-02-28")
+    assert ok == True, msg
+    
+    ok, msg = validate_advance_notice("2024/01/10", booking_date="2024-01-07")
+    assert ok == False
+    assert "Invalid date format" in msg
+    print("✓ test_validate_advance_notice_booking_date passed")
+
+
 def test_validate_operating_hours_weekday():
     """Test operating hours validation for weekdays."""
     # Monday - operating hours 9:00-20:00
@@ -270,7 +396,7 @@ def test_validate_operating_hours_sunday():
 def test_validate_event_comprehensive():
     """Test comprehensive event validation with all checks."""
     event = {
-        "event_date": (datetime.now() + timedelta(days=5)).strftime("%Y-%m-%d"),
+        "event_date": _IN_5_DAYS,
         "start_time": "10:00",
         "end_time": "12:00",
         "room_id": "R101",
@@ -287,13 +413,23 @@ def test_validate_event_comprehensive():
     # All validations should pass
     ok, errors = validate_event(event, existing_events, rooms)
     assert ok == True, f"Expected success but got errors: {errors}"
+    
+    # A prebuilt room index gives the same results
+    room_index = build_room_index(rooms)
+    assert validate_event(event, existing_events, rooms, room_index=room_index) == (True, [])
+    event["expected_attendance"] = "20"
+    event["room_id"] = "R102"
+    assert validate_event(event, existing_events, rooms, room_index=room_index) == \
+        validate_event(event, existing_events, rooms)
+    event["room_id"] = "R999"
+    assert validate_event(event, existing_events, [], room_index=room_index) == (False, ["Room R999 not found"])
     print("✓ test_validate_event_comprehensive passed")
 
 
 def test_validate_event_multiple_failures():
     """Test event validation with multiple validation failures."""
     event = {
-        "event_date": (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d"),  # Too soon
+        "event_date": _IN_1_DAY,  # Too soon
         "start_time": "10:00",
         "end_time": "12:00",
         "room_id": "R101",
@@ -321,42 +457,87 @@ def test_validate_event_multiple_failures():
     print("✓ test_validate_event_multiple_failures passed")
 
 
+def test_validate_event_fast_fail():
+    """Test that fast_fail stops at the first (cheapest) failing check."""
+    event = {
+        "event_date": _IN_1_DAY,  # Too soon
+        "start_time": "10:00",
+        "end_time": "12:00",
+        "room_id": "R101",
+        "expected_attendance": "50"  # Too many for room capacity 30
+    }
+    
+    existing_events = [
+        {
+            "event_id": "999",
+            "event_date": event["event_date"],
+            "start_time": "11:00",
+            "end_time": "13:00",
+            "room_id": "R101"
+        }
+    ]
+    
+    rooms = [
+        {"room_id": "R101", "capacity": "30"},
+    ]
+    
+    ok, errors = validate_event(event, existing_events, rooms, fast_fail=True)
+    assert ok == False
+    assert len(errors) == 1, f"Expected a single error but got: {errors}"
+    assert "advance notice" in errors[0].lower(), f"Expected advance notice error first: {errors}"
+    
+    # A valid event gives the same result either way
+    event["event_date"] = _IN_5_DAYS
+    event["expected_attendance"] = "25"
+    ok, errors = validate_event(event, [], rooms, fast_fail=True)
+    assert ok == True, f"Expected success but got errors: {errors}"
+    print("✓ test_validate_event_fast_fail passed")
+
+
+# Tests in run order, with names resolved once for reporting
+_TESTS = (
+    test_count_active_loans,
+    test_sum_outstanding_fines,
+    test_build_loan_and_fine_index,
+    test_validate_checkout_item_limit,
+    test_validate_checkout_fine_threshold,
+    test_validate_checkout_fast_fail,
+    test_detect_event_conflicts_no_conflict,
+    test_detect_event_conflicts_with_conflict,
+    test_detect_event_conflicts_edge_cases,
+    test_detect_event_conflicts_indexed,
+    test_validate_room_capacity_pass,
+    test_validate_room_capacity_fail,
+    test_validate_advance_notice_pass,
+    test_validate_advance_notice_fail,
+    test_validate_advance_notice_booking_date,
+    test_validate_operating_hours_weekday,
+    test_validate_operating_hours_sunday,
+    test_validate_event_comprehensive,
+    test_validate_event_multiple_failures,
+    test_validate_event_fast_fail,
+)
+_TEST_NAMES = tuple(t.__name__ for t in _TESTS)
+
+
 def run_all_tests():
     """Run all test functions."""
     print("\n" + "="*60)
     print("Running Phase 5 Validation Tests")
     print("="*60 + "\n")
     
-    test_functions = [
-        test_count_active_loans,
-        test_sum_outstanding_fines,
-        test_validate_checkout_item_limit,
-        test_validate_checkout_fine_threshold,
-        test_detect_event_conflicts_no_conflict,
-        test_detect_event_conflicts_with_conflict,
-        test_detect_event_conflicts_edge_cases,
-        test_validate_room_capacity_pass,
-        test_validate_room_capacity_fail,
-        test_validate_advance_notice_pass,
-        test_validate_advance_notice_fail,
-        test_validate_operating_hours_weekday,
-        test_validate_operating_hours_sunday,
-        test_validate_event_comprehensive,
-        test_validate_event_multiple_failures,
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_func in test_functions:
+    for test_func, name in zip(_TESTS, _TEST_NAMES):
         try:
             test_func()
             passed += 1
         except AssertionError as e:
-            print(f"✗ {test_func.__name__} FAILED: {e}")
+            print(f"✗ {name} FAILED: {e}")
             failed += 1
         except Exception as e:
-            print(f"✗ {test_func.__name__} ERROR: {e}")
+            print(f"✗ {name} ERROR: {e}")
             failed += 1
     
     print("\n" + "="*60)
@@ -4,14 +4,129 @@ Transaction Management functions for Phase 6.
 
 This module provides CRUD operations for library entities:
 - add_member(): Add new library members
+- add_members_bulk(): Add several members with a single write
 - renew_membership(): Extend membership expiry dates
+- renew_memberships_bulk(): Renew several memberships with a single write
 """
 
 import csv
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+import io
+import mmap
+import os
+import re
+import stat
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import date
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Shared with validation.py so both modules accept the same date strings
+from validation import _parse_ymd
+
+# Cross-process locking: msvcrt on Windows, fcntl everywhere else
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
+
+MEMBER_FIELDNAMES = ['member_id', 'name', 'address', 'email', 'phone',
+                     'membership_type', 'join_date', 'expiry_date', 'status']
+
+# Default location of members.csv, resolved once at import
+_DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent / 'data'
+
+# Accepted membership types, in the order listed in error messages
+MEMBERSHIP_TYPES = ('Standard', 'Premium', 'Student', 'Adult', 'Child')
+_VALID_TYPES = frozenset(MEMBERSHIP_TYPES)
+
+# Maps each accepted type to its single shared string, so new records reference
+# one object per type instead of the caller's copy
+_CANONICAL_TYPES = {t: t for t in MEMBERSHIP_TYPES}
+_INVALID_TYPE_MESSAGE = f"Invalid membership type. Must be one of: {', '.join(MEMBERSHIP_TYPES)}"
+
+# True (a match) if a string has any non-whitespace character
+_NONBLANK = re.compile(r'\S').search
+
+def _buffer_size_from_env(default: int = 1 << 20) -> int:
+    """Read LIBRARY_CSV_BUFFER_SIZE, falling back to default if unset or not a positive int."""
+    try:
+        size = int(os.environ.get('LIBRARY_CSV_BUFFER_SIZE', default))
+    except ValueError:
+        return default
+    return size if size > 0 else default
+
+
+# Buffer size for opening CSV files (1 MiB); override with the
+# LIBRARY_CSV_BUFFER_SIZE environment variable (bytes) to tune per deployment
+CSV_BUFFER_SIZE = _buffer_size_from_env()
+
+# members.csv header line without its terminator, as csv.DictWriter would write it
+_MEMBER_HEADER = ','.join(MEMBER_FIELDNAMES)
+
+# A file's (st_mtime_ns, st_size, st_ino), identifying one version of it
+_Signature = Tuple[int, int, int]
+
+# Parsed members.csv rows keyed by absolute path, stored with the file's
+# signature so unchanged files are not re-parsed
+_CSV_CACHE: Dict[str, Tuple[_Signature, List[Dict[str, str]]]] = {}
+
+# Next free member ID per absolute path, stored with the file signature it
+# was derived from so an outside change forces a fresh max() scan
+_NEXT_ID_CACHE: Dict[str, Tuple[_Signature, int]] = {}
+
+# member_id -> row index per absolute path, validated the same way
+_MEMBER_INDEX_CACHE: Dict[str, Tuple[_Signature, Dict[int, Dict[str, str]]]] = {}
+
+# Lowercased emails already registered per absolute path, validated the same way
+_EMAIL_CACHE: Dict[str, Tuple[_Signature, Set[str]]] = {}
+
+# Caches derived from _CSV_CACHE contents
+_DERIVED_CACHES: Tuple[Dict[str, Tuple[_Signature, Any]], ...] = (_NEXT_ID_CACHE, _MEMBER_INDEX_CACHE, _EMAIL_CACHE)
+
+# Guards the caches and the read-modify-write of members.csv within a process
+_MEMBERS_LOCK = threading.Lock()
+
+# Last write generation read from each data file's lock file (see _file_lock)
+_SEEN_GENERATION: Dict[str, int] = {}
+
+# Width of the zero-padded write generation stored in a lock file
+_GENERATION_WIDTH = 20
+
+
+def iter_csv_rows(filepath: Path) -> Iterator[Dict[str, str]]:
+    """Yield the rows of a CSV file one at a time.
+    
+    Rows are tokenized with the C ``csv.reader`` and zipped with the header,
+    which avoids ``csv.DictReader``'s per-row Python overhead while producing
+    the same dictionaries. Only the current row is held in memory, so callers
+    that need one value per row need not materialize the whole file.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Yields:
+        Dictionaries representing rows; as with csv.DictReader, a short row
+        has None for its missing fields and a long row keeps its extra
+        values in a list under the None key
+    """
+    with open(filepath, 'r', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as file:
+        reader = csv.reader(file)
+        header = next(reader, [])
+        width = len(header)
+        for row in reader:
+            if len(row) == width:
+                yield dict(zip(header, row))
+            elif row:
+                # Match csv.DictReader: pad short rows with None, keep extras under
+                # None; typed Any like DictReader's rows, as these break Dict[str, str]
+                record: Dict[Any, Any] = dict(zip(header, row + [None] * (width - len(row))))
+                if len(row) > width:
+                    record[None] = row[width:]
+                yield record
 
 
 def load_csv_data(filepath: Path) -> List[Dict[str, str]]:
@@ -23,41 +138,560 @@ def load_csv_data(filepath: Path) -> List[Dict[str, str]]:
     Returns:
         List of dictionaries representing rows
     """
-    data = []
-    with open(filepath, 'r', encoding='utf-8') as file:
-        reader = csv.DictReader(file)
-        data = list(reader)
+    return list(iter_csv_rows(filepath))
+
+
+def _add_twelve_months(d: date) -> date:
+    """Return the same calendar day one year later; Feb 29 becomes Feb 28."""
+    try:
+        return d.replace(year=d.year + 1)
+    except ValueError:
+        return d.replace(year=d.year + 1, day=28)
+
+
+def _file_signature(filepath: Path) -> _Signature:
+    """Return the stat fields that identify one version of a file."""
+    st = os.stat(filepath)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _cached_load(filepath: Path) -> List[Dict[str, str]]:
+    """Load a CSV file through the module cache.
+    
+    The cached list is shared: callers that change it must write the file and
+    call _update_cache(), or drop the entry with _invalidate_cache().
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    key = os.path.abspath(filepath)
+    signature = _file_signature(filepath)
+    cached = _CSV_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = load_csv_data(filepath)
+    _CSV_CACHE[key] = (signature, data)
     return data
 
 
-def write_csv_data(filepath: Path, data: List[Dict[str, str]], fieldnames: List[str]) -> None:
-    """Write data to a CSV file.
+def _update_cache(filepath: Path, data: List[Dict[str, str]]) -> None:
+    """Record data as the current contents of a file we just wrote.
+    
+    Values derived from the previous contents (next-ID counter, member index,
+    email set) are carried over; callers that add members update them
+    afterwards.
+    """
+    key = os.path.abspath(filepath)
+    signature = _file_signature(filepath)
+    previous = _CSV_CACHE.get(key)
+    for cache in _DERIVED_CACHES:
+        derived = cache.get(key)
+        if previous is not None and derived is not None and derived[0] == previous[0]:
+            cache[key] = (signature, derived[1])
+    _CSV_CACHE[key] = (signature, data)
+
+
+def _invalidate_cache(filepath: Path) -> None:
+    """Forget the cached contents of a file and the values derived from them."""
+    key = os.path.abspath(filepath)
+    _CSV_CACHE.pop(key, None)
+    for cache in _DERIVED_CACHES:
+        cache.pop(key, None)
+
+
+def clear_csv_cache() -> None:
+    """Forget all cached CSV contents and the values derived from them.
+    
+    Call this after changing a data file outside this module within the same
+    timestamp tick, which the stat signature cannot detect.
+    """
+    _CSV_CACHE.clear()
+    for cache in _DERIVED_CACHES:
+        cache.clear()
+    _SEEN_GENERATION.clear()
+
+
+@contextmanager
+def _file_lock(filepath: Path) -> Iterator[None]:
+    """Hold an exclusive cross-process lock for a data file.
+    
+    The lock is taken on a sidecar ``.<name>.lock`` file, because
+    write_csv_data replaces the data file itself. The lock file also stores a
+    write generation that every holder bumps on release: if another process
+    held the lock since our last visit, the cached contents are dropped, even
+    when its write left the file's size and timestamp unchanged.
+    
+    Raises:
+        FileNotFoundError: If the data file does not exist; no lock file is
+            created for it
+    """
+    directory, name = os.path.split(os.path.abspath(filepath))
+    os.stat(filepath)
+    fd = os.open(os.path.join(directory, f'.{name}.lock'), os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        if sys.platform == 'win32':
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            key = os.path.join(directory, name)
+            raw = os.read(fd, _GENERATION_WIDTH).strip()
+            generation = int(raw) if raw.isdigit() else 0
+            if _SEEN_GENERATION.get(key) != generation:
+                _invalidate_cache(filepath)
+            try:
+                yield
+            finally:
+                generation += 1
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.write(fd, str(generation).zfill(_GENERATION_WIDTH).encode('ascii'))
+                _SEEN_GENERATION[key] = generation
+        finally:
+            if sys.platform == 'win32':
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _patch_expiry_in_place(members_file: Path, member: Dict[str, str], new_expiry: str) -> bool:
+    """Overwrite one member's expiry_date bytes in members.csv without a rewrite.
+    
+    Only applies when the new value has the same byte length and the
+    member's line is a plain (unquoted) row whose fields match the cached
+    record exactly; otherwise nothing is written and False is returned so the
+    caller can fall back to write_csv_data.
+    
+    Returns:
+        True if the file was patched
+    """
+    if len(member) != len(MEMBER_FIELDNAMES):
+        return False
+    old_fields = [(member.get(name) or '').encode('utf-8') for name in MEMBER_FIELDNAMES]
+    new_value = new_expiry.encode('utf-8')
+    expiry_col = MEMBER_FIELDNAMES.index('expiry_date')
+    if len(new_value) != len(old_fields[expiry_col]):
+        return False
+    
+    with open(members_file, 'r+b') as file:
+        # Locate the line with a C-level search over the mapped file
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = mm.find(b'\n' + old_fields[0] + b',') + 1
+            if start == 0:
+                return False
+            end = mm.find(b'\n', start)
+            if end == -1:
+                end = len(mm)
+            line = mm[start:end].rstrip(b'\r')
+        if b'"' in line or line.split(b',') != old_fields:
+            return False
+        file.seek(start + sum(len(field) + 1 for field in old_fields[:expiry_col]))
+        file.write(new_value)
+        file.flush()
+        os.fsync(file.fileno())
+    return True
+
+
+def _cached_member_index(filepath: Path, members: List[Dict[str, str]]) -> Dict[int, Dict[str, str]]:
+    """Return a member_id -> row index for members freshly read by _cached_load.
+    
+    The index maps to the cached row objects, so in-place edits through it
+    are edits of the cached list. If an ID repeats, the first row wins, as
+    with a linear scan. Rows whose member_id is not an integer are left out,
+    so one malformed row cannot stop other members from being found.
+    """
+    key = os.path.abspath(filepath)
+    signature = _CSV_CACHE[key][0]
+    cached = _MEMBER_INDEX_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    index = {}
+    for member in reversed(members):
+        try:
+            member_id = int(member['member_id'])
+        except (TypeError, ValueError):
+            continue
+        index[member_id] = member
+    _MEMBER_INDEX_CACHE[key] = (signature, index)
+    return index
+
+
+def _cached_email_set(filepath: Path, members: List[Dict[str, str]]) -> Set[str]:
+    """Return the stripped, lowercased emails of members freshly read by _cached_load.
+    
+    The set is shared with the cache: callers add to it only after their new
+    rows have been written.
+    """
+    key = os.path.abspath(filepath)
+    signature = _CSV_CACHE[key][0]
+    cached = _EMAIL_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    emails = {m.get('email', '').strip().lower() for m in members}
+    _EMAIL_CACHE[key] = (signature, emails)
+    return emails
+
+
+def _esc(value) -> str:
+    """Format one CSV field, quoting only when the csv module would."""
+    if value is None:
+        return ''
+    if value.__class__ is not str:
+        value = str(value)
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if ',' in value or '\n' in value or '\r' in value:
+        return '"' + value + '"'
+    return value
+
+
+def _format_member_row(rec: Dict[str, str], lineterminator: str = '\r\n') -> Optional[str]:
+    """Format a members.csv record as one CSV line, ending in lineterminator.
+    
+    Returns:
+        The line, or None if rec does not have exactly the MEMBER_FIELDNAMES
+        keys (the caller then falls back to csv.DictWriter and its errors)
+    """
+    if len(rec) != len(MEMBER_FIELDNAMES):
+        return None
+    try:
+        return (f"{_esc(rec['member_id'])},{_esc(rec['name'])},{_esc(rec['address'])},"
+                f"{_esc(rec['email'])},{_esc(rec['phone'])},{_esc(rec['membership_type'])},"
+                f"{_esc(rec['join_date'])},{_esc(rec['expiry_date'])},{_esc(rec['status'])}{lineterminator}")
+    except KeyError:
+        return None
+
+
+def _serialize_rows(
+    rows: List[Dict[str, str]],
+    fieldnames: List[str],
+    header: bool,
+    lineterminator: str = '\r\n'
+) -> str:
+    """Serialize rows to CSV text, optionally preceded by the header line.
+    
+    members.csv rows use the prebuilt _format_member_row template. Other
+    files project each row to a tuple with one itemgetter call and write it
+    with csv.writer; rows that do not have exactly the given fields go
+    through csv.DictWriter, which pads or rejects them. Every line ends in
+    lineterminator (csv's default CRLF unless given).
+    """
+    if fieldnames == MEMBER_FIELDNAMES:
+        lines = [_MEMBER_HEADER + lineterminator] if header else []
+        for rec in rows:
+            line = _format_member_row(rec, lineterminator)
+            if line is None:
+                break
+            lines.append(line)
+        else:
+            return ''.join(lines)
+    
+    width = len(fieldnames)
+    buffer = io.StringIO()
+    if width > 1 and all(len(rec) == width for rec in rows):
+        try:
+            values = list(map(itemgetter(*fieldnames), rows))
+        except KeyError:
+            values = None
+        if values is not None:
+            tuple_writer = csv.writer(buffer, lineterminator=lineterminator)
+            if header:
+                tuple_writer.writerow(fieldnames)
+            tuple_writer.writerows(values)
+            return buffer.getvalue()
+    
+    dict_writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator=lineterminator)
+    if header:
+        dict_writer.writeheader()
+    dict_writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def _current_umask() -> int:
+    """Return the process umask (os.umask can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def write_csv_data(
+    filepath: Path,
+    data: List[Dict[str, str]],
+    fieldnames: List[str],
+    durable: bool = True
+) -> None:
+    """Write data to a CSV file atomically.
+    
+    Rows go to a temporary file in the same directory, which then replaces
+    the target with ``os.replace``, so a crash mid-write leaves the old file
+    intact instead of a truncated one. The existing file's permissions are
+    kept; a new file gets the usual umask-derived mode.
     
     Args:
         filepath: Path to the CSV file
         data: List of dictionaries to write
         fieldnames: List of column names
+        durable: fsync the new file (and its directory) before returning;
+            bulk loaders can pass False to skip the flush to disk
+    """
+    text = _serialize_rows(data, fieldnames, header=True)
+    
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f'.{os.path.basename(filepath)}.', suffix='.tmp', dir=directory
+    )
+    try:
+        with open(fd, 'w', encoding='utf-8', newline='', buffering=CSV_BUFFER_SIZE) as file:
+            file.write(text)
+            if durable:
+                file.flush()
+                os.fsync(file.fileno())
+        try:
+            mode = stat.S_IMODE(os.stat(filepath).st_mode)
+        except FileNotFoundError:
+            # New file: mkstemp made it 0600; give it the mode open() would
+            mode = 0o666 & ~_current_umask()
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    
+    if durable and hasattr(os, 'O_DIRECTORY'):
+        # Persist the rename itself (POSIX; not available on Windows)
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _line_terminator(fd: int) -> str:
+    """Return the terminator (CRLF or LF) ending the first line of an open file.
+    
+    Files whose first line is not terminated within the first 64 KiB get
+    csv's default CRLF.
     """
-    with open(filepath, 'w', encoding='utf-8', newline='') as file:
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+    os.lseek(fd, 0, os.SEEK_SET)
+    head = os.read(fd, 1 << 16)
+    end = head.find(b'\n')
+    if end == -1:
+        return '\r\n'
+    return '\r\n' if head[end - 1:end] == b'\r' else '\n'
 
 
-def generate_member_id(existing_members: List[Dict[str, str]]) -> int:
+def append_csv_rows(
+    filepath: Path,
+    rows: List[Dict[str, str]],
+    fieldnames: List[str],
+    durable: bool = True
+) -> None:
+    """Append rows to an existing CSV file with a single write.
+    
+    All rows are serialized into one buffer and written through an
+    ``O_APPEND`` descriptor, so adding records costs one write instead of
+    rewriting every existing row. The header is written if the file is empty,
+    and a missing final newline is repaired so the first new row never merges
+    into the last one. New lines end the way the file's first line does, so
+    appending never mixes LF and CRLF rows.
+    
+    Args:
+        filepath: Path to the CSV file
+        rows: List of dictionaries to write
+        fieldnames: List of column names, in file order
+        durable: fsync the file before returning, as write_csv_data does;
+            bulk loaders can pass False to skip the flush to disk
+    """
+    fd = os.open(filepath, os.O_RDWR | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        eol = _line_terminator(fd) if size > 0 else '\r\n'
+        text = _serialize_rows(rows, fieldnames, header=size == 0, lineterminator=eol)
+        if size > 0:
+            os.lseek(fd, size - 1, os.SEEK_SET)
+            if os.read(fd, 1) not in (b'\n', b'\r'):
+                text = eol + text
+        
+        data = memoryview(text.encode('utf-8'))
+        while data:
+            data = data[os.write(fd, data):]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def generate_member_id(existing_members: Iterable[Dict[str, str]]) -> int:
     """Generate a unique member ID.
     
     Args:
-        existing_members: List of existing member records
+        existing_members: Existing member records; a list, or a stream such as
+            iter_csv_rows(members_file)
         
     Returns:
         New unique member ID
     """
-    if not existing_members:
-        return 101
+    return max(map(int, map(itemgetter('member_id'), existing_members)), default=100) + 1
+
+
+def _validate_member_fields(
+    name: str,
+    address: str,
+    email: str,
+    phone: str,
+    membership_type: str
+) -> Optional[str]:
+    """Check required member fields and membership type.
+    
+    Returns:
+        Error message, or None if the fields are valid
+    """
+    # Validate required fields, in order, stopping at the first blank one
+    for value, error in (
+        (name, "Name is required"),
+        (address, "Address is required"),
+        (email, "Email is required"),
+        (phone, "Phone is required"),
+        (membership_type, "Membership type is required"),
+    ):
+        if not value or not _NONBLANK(value):
+            return error
+    
+    # Validate membership type
+    if membership_type not in _VALID_TYPES:
+        return _INVALID_TYPE_MESSAGE
+    
+    return None
+
+
+def _append_member_records(
+    records: List[Dict[str, str]],
+    members_file: Path
+) -> Tuple[str, Optional[int], List[int]]:
+    """Append already field-validated records to members.csv; see _insert_members.
+    
+    Must be called with the members lock held.
+    
+    Raises:
+        FileNotFoundError: If members.csv does not exist
+    """
+    # Load existing members (cached while members.csv is unchanged)
+    existing_members = _cached_load(members_file)
+    
+    # Emails already registered (cached), and those claimed earlier in this batch
+    taken_emails = _cached_email_set(members_file, existing_members)
+    batch_emails = set()
+    
+    # Generate consecutive member IDs; the max() scan runs only when
+    # members.csv changed outside this module
+    key = os.path.abspath(members_file)
+    cached_id = _NEXT_ID_CACHE.get(key)
+    if cached_id is not None and cached_id[0] == _CSV_CACHE[key][0]:
+        next_id = cached_id[1]
+    else:
+        next_id = generate_member_id(existing_members)
+    today = None
+    
+    new_members: List[Dict[str, str]] = []
+    for index, record in enumerate(records):
+        # Check for duplicate email
+        email = record['email'].strip()
+        email_lower = email.lower()
+        if email_lower in taken_emails or email_lower in batch_emails:
+            return "Email already registered", index, []
+        batch_emails.add(email_lower)
+        
+        # Set join date (default to today)
+        join_date = record.get('join_date')
+        if join_date is None:
+            if today is None:
+                today = date.today()
+            join_date_obj = today
+            join_date = join_date_obj.isoformat()
+        else:
+            try:
+                join_date_obj = _parse_ymd(join_date)
+            except ValueError:
+                return "Invalid join_date format. Use YYYY-MM-DD", index, []
+        
+        # Calculate expiry date (12 months from join date)
+        expiry_date = _add_twelve_months(join_date_obj).isoformat()
+        
+        # Create new member record
+        new_members.append({
+            'member_id': str(next_id + len(new_members)),
+            'name': record['name'].strip(),
+            'address': record['address'].strip(),
+            'email': email,
+            'phone': record['phone'].strip(),
+            'membership_type': _CANONICAL_TYPES[record['membership_type']],
+            'join_date': join_date,
+            'expiry_date': expiry_date,
+            'status': 'active'
+        })
+    
+    # Append only the new rows; existing rows are left untouched on disk
+    if new_members:
+        try:
+            append_csv_rows(members_file, new_members, MEMBER_FIELDNAMES)
+        except Exception:
+            _invalidate_cache(members_file)
+            raise
+        existing_members.extend(new_members)
+        _update_cache(members_file, existing_members)
+        _NEXT_ID_CACHE[key] = (_CSV_CACHE[key][0], next_id + len(new_members))
+        cached_emails = _EMAIL_CACHE.get(key)
+        if cached_emails is not None and cached_emails[0] == _CSV_CACHE[key][0]:
+            cached_emails[1].update(batch_emails)
+        cached_index = _MEMBER_INDEX_CACHE.get(key)
+        if cached_index is not None and cached_index[0] == _CSV_CACHE[key][0]:
+            for offset, member in enumerate(new_members):
+                cached_index[1].setdefault(next_id + offset, member)
+    
+    return "", None, list(range(next_id, next_id + len(new_members)))
+
+
+def _insert_members(
+    records: List[Dict[str, str]],
+    data_dir: Optional[Path]
+) -> Tuple[str, Optional[int], List[int]]:
+    """Validate records and append them to members.csv in one write.
+    
+    Nothing is written unless every record is valid.
+    
+    Args:
+        records: Member dictionaries with the add_member() field names
+        data_dir: Directory containing members.csv (defaults to ../data relative to this script)
+        
+    Returns:
+        Tuple of (error: str, failed_index: Optional[int], member_ids: List[int]);
+        error is empty on success and failed_index is None for file-level errors
+    """
+    for index, record in enumerate(records):
+        error = _validate_member_fields(
+            record.get('name', ''), record.get('address', ''), record.get('email', ''),
+            record.get('phone', ''), record.get('membership_type', '')
+        )
+        if error:
+            return error, index, []
+    
+    # Set default data directory if not provided
+    if data_dir is None:
+        data_dir = _DEFAULT_DATA_DIR
+    
+    members_file = data_dir / 'members.csv'
     
-    max_id = max(int(m['member_id']) for m in existing_members)
-    return max_id + 1
+    # Serialize the shared cache and ID counter across threads and processes
+    try:
+        with _MEMBERS_LOCK, _file_lock(members_file):
+            return _append_member_records(records, members_file)
+    except FileNotFoundError:
+        return f"Members file not found: {members_file}", None, []
 
 
 def add_member(
@@ -86,86 +720,127 @@ def add_member(
     Returns:
         Tuple of (success: bool, message: str, member_id: Optional[int])
     """
-    # Validate required fields
-    if not name or not name.strip():
-        return False, "Name is required", None
-    if not address or not address.strip():
-        return False, "Address is required", None
-    if not email or not email.strip():
-        return False, "Email is required", None
-    if not phone or not phone.strip():
-        return False, "Phone is required", None
-    if not membership_type or not membership_type.strip():
-        return False, "Membership type is required", None
+    record = {
+        'name': name,
+        'address': address,
+        'email': email,
+        'phone': phone,
+        'membership_type': membership_type,
+    }
+    if join_date is not None:
+        record['join_date'] = join_date
+    error, _, member_ids = _insert_members([record], data_dir)
+    if error:
+        return False, error, None
     
-    # Validate membership type
-    valid_types = ['Standard', 'Premium', 'Student', 'Adult', 'Child']
-    if membership_type not in valid_types:
-        return False, f"Invalid membership type. Must be one of: {', '.join(valid_types)}", None
+    member_id = member_ids[0]
+    return True, f"Member added successfully with ID: {member_id}", member_id
+
+
+def add_members_bulk(
+    records: List[Dict[str, str]],
+    data_dir: Optional[Path] = None
+) -> Tuple[bool, str, List[int]]:
+    """
+    Add several members with one read and one write of members.csv.
     
-    # Set default data directory if not provided
-    if data_dir is None:
-        data_dir = Path(__file__).parent.parent / 'data'
+    Each record takes the add_member() arguments as keys (name, address,
+    email, phone, membership_type and optional join_date) and is validated
+    the same way; emails must also be unique within the batch. The batch is
+    all-or-nothing: if any record is invalid, nothing is written.
     
-    members_file = data_dir / 'members.csv'
+    Args:
+        records: List of member dictionaries
+        data_dir: Directory containing members.csv (defaults to ../data relative to this script)
+        
+    Returns:
+        Tuple of (success: bool, message: str, member_ids: List[int])
+    """
+    error, failed_index, member_ids = _insert_members(records, data_dir)
+    if error:
+        if failed_index is not None:
+            error = f"Record {failed_index}: {error}"
+        return False, error, []
     
-    # Check if members.csv exists
-    if not members_file.exists():
-        return False, f"Members file not found: {members_file}", None
+    return True, f"{len(member_ids)} members added successfully", member_ids
+
+
+def _renewed_expiry(member: Dict[str, str], today: date) -> Optional[str]:
+    """Return a member's expiry date after a 12-month renewal, or None if unparseable.
     
-    # Load existing members
-    existing_members = load_csv_data(members_file)
+    Per workflow spec: if not expired, extend from current expiry; if expired,
+    extend from today.
+    """
+    try:
+        expiry_date_obj = _parse_ymd(member['expiry_date'])
+    except ValueError:
+        return None
     
-    # Check for duplicate email
-    email_lower = email.strip().lower()
-    for existing_member in existing_members:
-        if existing_member.get('email', '').strip().lower() == email_lower:
-            return False, "Email already registered", None
+    if expiry_date_obj >= today:
+        # Not expired: extend from current expiry
+        return _add_twelve_months(expiry_date_obj).isoformat()
+    # Expired: extend from today
+    return _add_twelve_months(today).isoformat()
+
+
+def _renew_member_record(
+    member_id: int,
+    members_file: Path,
+    today: Optional[date]
+) -> Tuple[bool, str]:
+    """Renew one member in members.csv; see renew_membership.
     
-    # Generate unique member ID
-    member_id = generate_member_id(existing_members)
+    Must be called with the members lock held.
     
-    # Set join date (default to today)
-    if join_date is None:
-        join_date_obj = datetime.now()
-        join_date = join_date_obj.strftime('%Y-%m-%d')
-    else:
-        try:
-            join_date_obj = datetime.strptime(join_date, '%Y-%m-%d')
-        except ValueError:
-            return False, "Invalid join_date format. Use YYYY-MM-DD", None
-    
-    # Calculate expiry date (12 months from join date)
-    expiry_date_obj = join_date_obj + relativedelta(months=12)
-    expiry_date = expiry_date_obj.strftime('%Y-%m-%d')
-    
-    # Create new member record
-    new_member = {
-        'member_id': str(member_id),
-        'name': name.strip(),
-        'address': address.strip(),
-        'email': email.strip(),
-        'phone': phone.strip(),
-        'membership_type': membership_type,
-        'join_date': join_date,
-        'expiry_date': expiry_date,
-        'status': 'active'
-    }
+    Raises:
+        FileNotFoundError: If members.csv does not exist
+    """
+    # Load existing members (cached while members.csv is unchanged)
+    members = _cached_load(members_file)
+    
+    # Find member by ID through the cached member_id index
+    if today is None:
+        today = date.today()
     
-    # Add new member to list
-    existing_members.append(new_member)
+    member = _cached_member_index(members_file, members).get(member_id)
+    if member is None:
+        return False, f"Member with ID {member_id} not found"
     
-    # Write updated data back to CSV
-    fieldnames = ['member_id', 'name', 'address', 'email', 'phone', 
-                  'membership_type', 'join_date', 'expiry_date', 'status']
-    write_csv_data(members_file, existing_members, fieldnames)
+    new_expiry_date = _renewed_expiry(member, today)
+    if new_expiry_date is None:
+        return False, f"Invalid expiry_date format in member record: {member['expiry_date']}"
     
-    return True, f"Member added successfully with ID: {member_id}", member_id
+    # Active members only need their expiry_date bytes patched in place
+    try:
+        if member['status'] != 'expired' and _patch_expiry_in_place(members_file, member, new_expiry_date):
+            member['expiry_date'] = new_expiry_date
+            _update_cache(members_file, members)
+            return True, f"Membership renewed successfully for member ID: {member_id}. New expiry date: {new_expiry_date}"
+    except Exception:
+        _invalidate_cache(members_file)
+        raise
+    
+    member['expiry_date'] = new_expiry_date
+    
+    # Update status to active if it was expired
+    if member['status'] == 'expired':
+        member['status'] = 'active'
+    
+    # Write updated data back to CSV; the cached rows already hold the change
+    try:
+        write_csv_data(members_file, members, MEMBER_FIELDNAMES)
+    except Exception:
+        _invalidate_cache(members_file)
+        raise
+    _update_cache(members_file, members)
+    
+    return True, f"Membership renewed successfully for member ID: {member_id}. New expiry date: {new_expiry_date}"
 
 
 def renew_membership(
     member_id: int,
-    data_dir: Optional[Path] = None
+    data_dir: Optional[Path] = None,
+    today: Optional[date] = None
 ) -> Tuple[bool, str]:
     """
     Renew a member's membership by extending expiry date by 12 months.
@@ -179,62 +854,99 @@ def renew_membership(
     Args:
         member_id: ID of the member to renew
         data_dir: Directory containing members.csv (defaults to ../data relative to this script)
+        today: Date to treat as today for the expiry check (defaults to the current date)
         
     Returns:
         Tuple of (success: bool, message: str)
     """
     # Set default data directory if not provided
     if data_dir is None:
-        data_dir = Path(__file__).parent.parent / 'data'
+        data_dir = _DEFAULT_DATA_DIR
     
     members_file = data_dir / 'members.csv'
     
-    # Check if members.csv exists
-    if not members_file.exists():
+    # Serialize the shared cache and the rewrite across threads and processes
+    try:
+        with _MEMBERS_LOCK, _file_lock(members_file):
+            return _renew_member_record(member_id, members_file, today)
+    except FileNotFoundError:
         return False, f"Members file not found: {members_file}"
+
+
+def _renew_member_records(
+    member_ids: List[int],
+    members_file: Path,
+    today: Optional[date]
+) -> Tuple[bool, str]:
+    """Renew several members in members.csv with one rewrite; see renew_memberships_bulk.
     
-    # Load existing members
-    members = load_csv_data(members_file)
+    Must be called with the members lock held.
     
-    # Find member by ID and update expiry date
-    new_expiry_date = ""
-    member_found = False
-    today = datetime.now().date()
+    Raises:
+        FileNotFoundError: If members.csv does not exist
+    """
+    members = _cached_load(members_file)
+    index = _cached_member_index(members_file, members)
+    if today is None:
+        today = date.today()
     
-    for member in members:
-        if int(member['member_id']) == member_id:
-            member_found = True
-            
-            # Parse current expiry date
-            try:
-                expiry_date_obj = datetime.strptime(member['expiry_date'], '%Y-%m-%d').date()
-            except ValueError:
-                return False, f"Invalid expiry_date format in member record: {member['expiry_date']}"
-            
-            # Calculate new expiry date based on current status
-            # Per workflow spec: if not expired, extend from current expiry; if expired, extend from today
-            if expiry_date_obj >= today:
-                # Not expired: extend from current expiry
-                new_expiry_date_obj = datetime.combine(expiry_date_obj, datetime.min.time()) + relativedelta(months=12)
-            else:
-                # Expired: extend from today
-                new_expiry_date_obj = datetime.combine(today, datetime.min.time()) + relativedelta(months=12)
-            
-            new_expiry_date = new_expiry_date_obj.strftime('%Y-%m-%d')
-            member['expiry_date'] = new_expiry_date
-            
-            # Update status to active if it was expired
-            if member['status'] == 'expired':
-                member['status'] = 'active'
-            
-            break
-    
-    if not member_found:
-        return False, f"Member with ID {member_id} not found"
+    # Work out every new expiry date before touching the cached rows
+    renewals = {}
+    for member_id in member_ids:
+        member = index.get(member_id)
+        if member is None:
+            return False, f"Member with ID {member_id} not found"
+        if member_id in renewals:
+            return False, f"Member ID {member_id} listed more than once"
+        new_expiry_date = _renewed_expiry(member, today)
+        if new_expiry_date is None:
+            return False, f"Invalid expiry_date format in member record {member_id}: {member['expiry_date']}"
+        renewals[member_id] = new_expiry_date
     
-    # Write updated data back to CSV
-    fieldnames = ['member_id', 'name', 'address', 'email', 'phone', 
-                  'membership_type', 'join_date', 'expiry_date', 'status']
-    write_csv_data(members_file, members, fieldnames)
+    for member_id, new_expiry_date in renewals.items():
+        member = index[member_id]
+        member['expiry_date'] = new_expiry_date
+        if member['status'] == 'expired':
+            member['status'] = 'active'
     
-    return True, f"Membership renewed successfully for member ID: {member_id}. New expiry date: {new_expiry_date}"
+    try:
+        write_csv_data(members_file, members, MEMBER_FIELDNAMES)
+    except Exception:
+        _invalidate_cache(members_file)
+        raise
+    _update_cache(members_file, members)
+    
+    return True, f"{len(renewals)} memberships renewed successfully"
+
+
+def renew_memberships_bulk(
+    member_ids: List[int],
+    data_dir: Optional[Path] = None,
+    today: Optional[date] = None
+) -> Tuple[bool, str]:
+    """
+    Renew several memberships with one read and one write of members.csv.
+    
+    Each member is renewed exactly as renew_membership() would. The batch is
+    all-or-nothing: if any ID is unknown, repeated, or has an unreadable
+    expiry date, nothing is written.
+    
+    Args:
+        member_ids: IDs of the members to renew
+        data_dir: Directory containing members.csv (defaults to ../data relative to this script)
+        today: Date to treat as today for the expiry check (defaults to the current date)
+        
+    Returns:
+        Tuple of (success: bool, message: str)
+    """
+    if data_dir is None:
+        data_dir = _DEFAULT_DATA_DIR
+    
+    members_file = data_dir / 'members.csv'
+    
+    # Serialize the shared cache and the rewrite across threads and processes
+    try:
+        with _MEMBERS_LOCK, _file_lock(members_file):
+            return _renew_member_records(member_ids, members_file, today)
+    except FileNotFoundError:
+        return False, f"Members file not found: {members_file}"
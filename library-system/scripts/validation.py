@@ -13,7 +13,11 @@ Centralizes policy-based checks:
 Note: Membership type naming inconsistency is handled by providing a default and aliases.
 """
 
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 from typing import Dict, List, Tuple
 from typing import Optional
 
@@ -27,6 +31,9 @@ MEMBERSHIP_LIMITS: Dict[str, int] = {
     "Child": 3,   # per policy: child membership limit = 3 items
 }
 
+# Item limit applied to membership types missing from the limits table
+DEFAULT_ITEM_LIMIT = 5
+
 FINE_THRESHOLD_DEFAULT = 10.00
 
 
@@ -72,14 +79,52 @@ def sum_outstanding_fines(fines: List[dict], member_id: int) -> float:
     return round(total, 2)
 
 
+def build_loan_index(transactions: List[dict]) -> Dict[int, int]:
+    """Count active loans (no return_date) per member_id in one pass.
+
+    index.get(member_id, 0) equals count_active_loans(transactions, member_id).
+    Malformed entries are skipped, as in the linear count.
+    """
+    index: Dict[int, int] = {}
+    for t in transactions:
+        if t.get("return_date"):
+            continue
+        try:
+            t_member_id_int = int(t.get("member_id", -1))
+        except (TypeError, ValueError):
+            continue
+        index[t_member_id_int] = index.get(t_member_id_int, 0) + 1
+    return index
+
+
+def build_fine_index(fines: List[dict]) -> Dict[int, float]:
+    """Total outstanding fines per member_id in one pass.
+
+    round(index.get(member_id, 0.0), 2) equals sum_outstanding_fines(fines, member_id).
+    """
+    index: Dict[int, float] = {}
+    for f in fines:
+        try:
+            f_member_id_int = int(f.get("member_id", -1))
+        except (TypeError, ValueError):
+            continue
+        status = (f.get("status") or "").strip().lower()
+        paid_date = f.get("paid_date")
+        if status != "paid" or not paid_date:
+            try:
+                amount = float(f.get("amount", 0) or 0)
+            except (TypeError, ValueError):
+                continue
+            index[f_member_id_int] = index.get(f_member_id_int, 0.0) + amount
+    return index
+
+
 def validate_item_limit(member: dict, active_loan_count: int, membership_limits: Dict[str, int] | None = None) -> Tuple[bool, str]:
     """Ensure member has not exceeded item limit for their membership type."""
     limits = membership_limits or MEMBERSHIP_LIMITS
     mtype = (member.get("membership_type") or "").strip()
-    limit = limits.get(mtype)
-    if limit is None:
-        # Unknown type: default to conservative 5
-        limit = 5
+    # Unknown type: default to conservative limit
+    limit = limits.get(mtype, DEFAULT_ITEM_LIMIT)
     if active_loan_count >= limit:
         return False, f"Item limit exceeded ({active_loan_count}/{limit}) for membership_type='{mtype}'"
     return True, ""
@@ -98,9 +143,21 @@ def validate_checkout(
     fines: List[dict],
     membership_limits: Dict[str, int] | None = None,
     fine_threshold: float = FINE_THRESHOLD_DEFAULT,
+    loan_index: Optional[Dict[int, int]] = None,
+    fine_index: Optional[Dict[int, float]] = None,
+    *,
+    fast_fail: bool = False,
 ) -> Tuple[bool, List[str]]:
     """Validate all checkout prerequisites for a member.
 
+    Pass loan_index/fine_index (from build_loan_index/build_fine_index) when
+    validating many checkouts against the same records; the corresponding
+    transactions/fines list is then not scanned.
+
+    With fast_fail=True the fine check runs first (fines are usually fewer
+    than transactions) and a failure returns before the loans are counted.
+    The default reports every error, item limit first.
+
     Returns (ok, errors).
     """
     errors: List[str] = []
@@ -114,15 +171,31 @@ def validate_checkout(
     except (TypeError, ValueError):
         return False, [f"Invalid member_id: {member_id_raw!r}"]
 
-    active_loans = count_active_loans(transactions, member_id)
-    ok, msg = validate_item_limit(member, active_loans, membership_limits)
-    if not ok:
-        errors.append(msg)
+    def check_item_limit():
+        if loan_index is not None:
+            active_loans = loan_index.get(member_id, 0)
+        else:
+            active_loans = count_active_loans(transactions, member_id)
+        return validate_item_limit(member, active_loans, membership_limits)
 
-    outstanding = sum_outstanding_fines(fines, member_id)
-    ok, msg = validate_fine_threshold(outstanding, fine_threshold)
-    if not ok:
-        errors.append(msg)
+    def check_fines():
+        if fine_index is not None:
+            outstanding = round(fine_index.get(member_id, 0.0), 2)
+        else:
+            outstanding = sum_outstanding_fines(fines, member_id)
+        return validate_fine_threshold(outstanding, fine_threshold)
+
+    if fast_fail:
+        checks = (check_fines, check_item_limit)
+    else:
+        checks = (check_item_limit, check_fines)
+
+    for check in checks:
+        ok, msg = check()
+        if not ok:
+            if fast_fail:
+                return False, [msg]
+            errors.append(msg)
 
     return (len(errors) == 0), errors
 
@@ -144,8 +217,130 @@ OPERATING_HOURS = {
 
 ADVANCE_NOTICE_DAYS = 3  # Events require at least 3 days advance notice
 
+# Day names in datetime.weekday() order (Monday == 0)
+_WEEKDAY_NAMES: Tuple[str, ...] = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday",
+)
+
+
+def _hhmm_to_minutes(time_str: str) -> int:
+    """Convert an 'HH:MM' string to minutes since midnight.
+
+    Accepts what strptime's '%H:%M' accepts (1-2 digit fields, 00:00-23:59)
+    and raises ValueError otherwise.
+    """
+    hours, sep, minutes = time_str.partition(":")
+    if (not sep or not (0 < len(hours) <= 2 and hours.isdigit())
+            or not (0 < len(minutes) <= 2 and minutes.isdigit())):
+        raise ValueError(f"time data {time_str!r} does not match format '%H:%M'")
+    hour, minute = int(hours), int(minutes)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"time data {time_str!r} does not match format '%H:%M'")
+    return hour * 60 + minute
+
+
+def _parse_ymd(date_str: str) -> date:
+    """Parse a 'YYYY-MM-DD' string; raises ValueError like strptime.
+
+    The zero-padded form goes through the C ``date.fromisoformat``; otherwise
+    falls back to accepting unpadded month/day fields, as '%Y-%m-%d' does.
+    """
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    parts = date_str.split("-")
+    if (len(parts) != 3 or not (len(parts[0]) == 4 and parts[0].isdigit())
+            or not all(0 < len(p) <= 2 and p.isdigit() for p in parts[1:])):
+        raise ValueError(f"time data {date_str!r} does not match format '%Y-%m-%d'")
+    return date(int(parts[0]), int(parts[1]), int(parts[2]))
+
+
+# OPERATING_HOURS as (open, close) minutes since midnight, indexed by weekday()
+_OPERATING_MINUTES: Tuple[Tuple[int, int], ...] = tuple(
+    (_hhmm_to_minutes(OPERATING_HOURS[day][0]), _hhmm_to_minutes(OPERATING_HOURS[day][1]))
+    for day in _WEEKDAY_NAMES
+)
+
+
+@lru_cache(maxsize=512)
+def _weekday_of(date_str: str) -> int:
+    """Return weekday() for a 'YYYY-MM-DD' string, memoized since events share dates.
+    
+    Raises ValueError like _parse_ymd (errors are not cached).
+    """
+    return _parse_ymd(date_str).weekday()
+
 
-def detect_event_conflicts(new_event: dict, existing_events: List[dict]) -> Tuple[bool, str]:
+# (room_id, event_date) -> (starts, ends, running max of ends, events), sorted by start
+EventIndex = Dict[Tuple[str, str], Tuple[List[int], List[int], List[int], List[dict]]]
+
+
+def build_event_index(events: List[dict]) -> EventIndex:
+    """Group events by (room_id, event_date) for repeated conflict checks.
+    
+    Each bucket holds parallel lists sorted by start time (minutes since
+    midnight), so detect_event_conflicts can bisect to the candidate window
+    instead of scanning every event. Build once and reuse across many checks.
+    Malformed events are skipped, as in the unindexed scan.
+    
+    Args:
+        events: List of event dicts with event_date, start_time, end_time, room_id
+        
+    Returns:
+        Index suitable for the event_index argument of detect_event_conflicts
+    """
+    buckets: Dict[Tuple[str, str], List[Tuple[int, int, dict]]] = {}
+    for event in events:
+        try:
+            key = (event.get("room_id", "").strip(), event.get("event_date", "").strip())
+            start_min = _hhmm_to_minutes(event.get("start_time", "").strip())
+            end_min = _hhmm_to_minutes(event.get("end_time", "").strip())
+        except (ValueError, TypeError):
+            continue
+        buckets.setdefault(key, []).append((start_min, end_min, event))
+    
+    index: EventIndex = {}
+    for key, entries in buckets.items():
+        entries.sort(key=itemgetter(0))
+        ends = [end_min for _, end_min, _ in entries]
+        index[key] = (
+            [start_min for start_min, _, _ in entries],
+            ends,
+            list(accumulate(ends, max)),
+            [event for _, _, event in entries],
+        )
+    return index
+
+
+def _find_indexed_conflict(bucket: Tuple[List[int], List[int], List[int], List[dict]],
+                           new_start_min: int, new_end_min: int) -> Optional[dict]:
+    """Return an event in the bucket overlapping [new_start_min, new_end_min), if any."""
+    starts, ends, max_ends, events = bucket
+    # Only events starting before the new end can overlap; walk back from there
+    # until no earlier event ends after the new start.
+    j = bisect_left(starts, new_end_min) - 1
+    while j >= 0 and max_ends[j] > new_start_min:
+        if ends[j] > new_start_min:
+            return events[j]
+        j -= 1
+    return None
+
+
+def _conflict_message(event: dict, room_id: str, event_date: str) -> str:
+    """Format the scheduling-conflict error for an overlapping existing event."""
+    event_id = event.get("event_id", "unknown")
+    event_start = event.get("start_time", "").strip()
+    event_end = event.get("end_time", "").strip()
+    return (
+        f"Scheduling conflict with event {event_id} in room {room_id} "
+        f"on {event_date} ({event_start}-{event_end})"
+    )
+
+
+def detect_event_conflicts(new_event: dict, existing_events: List[dict],
+                           event_index: Optional[EventIndex] = None) -> Tuple[bool, str]:
     """Check for scheduling conflicts with existing events.
     
     Detects conflicts when:
@@ -154,6 +349,8 @@ def detect_event_conflicts(new_event: dict, existing_events: List[dict]) -> Tupl
     Args:
         new_event: Event dict with event_date, start_time, end_time, room_id
         existing_events: List of event dicts to check against
+        event_index: Optional prebuilt build_event_index(existing_events); when
+            given, only same-room same-day candidates are examined
         
     Returns:
         (ok, error_message) - ok is False if conflict exists
@@ -167,13 +364,22 @@ def detect_event_conflicts(new_event: dict, existing_events: List[dict]) -> Tupl
         if not all([new_date, new_start, new_end, new_room]):
             return False, "Event missing required fields (event_date, start_time, end_time, room_id)"
         
-        # Parse new event times
-        new_start_dt = datetime.strptime(f"{new_date} {new_start}", "%Y-%m-%d %H:%M")
-        new_end_dt = datetime.strptime(f"{new_date} {new_end}", "%Y-%m-%d %H:%M")
+        # Parse new event times as minutes since midnight (the date only needs validating)
+        _parse_ymd(new_date)
+        new_start_min = _hhmm_to_minutes(new_start)
+        new_end_min = _hhmm_to_minutes(new_end)
         
-        if new_end_dt <= new_start_dt:
+        if new_end_min <= new_start_min:
             return False, f"Event end time ({new_end}) must be after start time ({new_start})"
         
+        if event_index is not None:
+            bucket = event_index.get((new_room, new_date))
+            if bucket is not None:
+                conflict = _find_indexed_conflict(bucket, new_start_min, new_end_min)
+                if conflict is not None:
+                    return False, _conflict_message(conflict, new_room, new_date)
+            return True, ""
+        
         # Check for conflicts with existing events
         for event in existing_events:
             try:
@@ -187,17 +393,13 @@ def detect_event_conflicts(new_event: dict, existing_events: List[dict]) -> Tupl
                     continue
                 
                 # Parse existing event times
-                event_start_dt = datetime.strptime(f"{event_date} {event_start}", "%Y-%m-%d %H:%M")
-                event_end_dt = datetime.strptime(f"{event_date} {event_end}", "%Y-%m-%d %H:%M")
+                event_start_min = _hhmm_to_minutes(event_start)
+                event_end_min = _hhmm_to_minutes(event_end)
                 
                 # Check for time overlap: events conflict if they overlap
                 # Overlap occurs if: new_start < event_end AND new_end > event_start
-                if new_start_dt < event_end_dt and new_end_dt > event_start_dt:
-                    event_id = event.get("event_id", "unknown")
-                    return False, (
-                        f"Scheduling conflict with event {event_id} in room {new_room} "
-                        f"on {new_date} ({event_start}-{event_end})"
-                    )
+                if new_start_min < event_end_min and new_end_min > event_start_min:
+                    return False, _conflict_message(event, new_room, new_date)
             except (ValueError, TypeError):
                 # Skip malformed events in existing list
                 continue
@@ -208,6 +410,23 @@ def detect_event_conflicts(new_event: dict, existing_events: List[dict]) -> Tupl
     return True, ""
 
 
+def build_room_index(rooms: List[dict]) -> Dict[str, dict]:
+    """Map stripped room_id to room dict for repeated validate_event calls.
+    
+    If a room_id repeats, the first room wins, as with a linear scan.
+    
+    Args:
+        rooms: List of room dicts with room_id
+        
+    Returns:
+        Index suitable for the room_index argument of validate_event
+    """
+    index: Dict[str, dict] = {}
+    for room in rooms:
+        index.setdefault(room.get("room_id", "").strip(), room)
+    return index
+
+
 def validate_room_capacity(event: dict, room: dict) -> Tuple[bool, str]:
     """Ensure event attendance doesn't exceed room capacity.
     
@@ -248,14 +467,15 @@ def validate_advance_notice(event_date: str, booking_date: Optional[str] = None,
         (ok, error_message) - ok is False if insufficient notice
     """
     try:
-        event_dt = datetime.strptime(event_date, "%Y-%m-%d")
+        event_day = _parse_ymd(event_date).toordinal()
         
         if booking_date is None:
-            booking_dt = datetime.now()
+            booking_day = date.today().toordinal()
         else:
-            booking_dt = datetime.strptime(booking_date, "%Y-%m-%d")
+            booking_day = _parse_ymd(booking_date).toordinal()
         
-        days_until_event = (event_dt - booking_dt).days
+        # Whole calendar days between booking and event
+        days_until_event = event_day - booking_day
         
         if days_until_event < min_days:
             return False, (
@@ -286,25 +506,15 @@ def validate_operating_hours(event_date: str, start_time: str, end_time: str) ->
         (ok, error_message) - ok is False if outside operating hours
     """
     try:
-        event_dt = datetime.strptime(event_date, "%Y-%m-%d")
-        day_name = event_dt.strftime("%A")
+        weekday = _weekday_of(event_date)
+        open_min, close_min = _OPERATING_MINUTES[weekday]
         
-        if day_name not in OPERATING_HOURS:
-            return False, f"Unknown day of week: {day_name}"
-        
-        open_time, close_time = OPERATING_HOURS[day_name]
-        
-        # Convert times to comparable format (minutes since midnight)
-        def time_to_minutes(time_str: str) -> int:
-            h, m = map(int, time_str.split(":"))
-            return h * 60 + m
-        
-        event_start_min = time_to_minutes(start_time)
-        event_end_min = time_to_minutes(end_time)
-        open_min = time_to_minutes(open_time)
-        close_min = time_to_minutes(close_time)
+        event_start_min = _hhmm_to_minutes(start_time)
+        event_end_min = _hhmm_to_minutes(end_time)
         
         if event_start_min < open_min or event_end_min > close_min:
+            day_name = _WEEKDAY_NAMES[weekday]
+            open_time, close_time = OPERATING_HOURS[day_name]
             return False, (
                 f"Event time ({start_time}-{end_time}) outside operating hours "
                 f"for {day_name} ({open_time}-{close_time})"
@@ -317,7 +527,10 @@ def validate_operating_hours(event_date: str, start_time: str, end_time: str) ->
 
 
 def validate_event(event: dict, existing_events: List[dict], rooms: List[dict], 
-                   booking_date: Optional[str] = None) -> Tuple[bool, List[str]]:
+                   booking_date: Optional[str] = None,
+                   event_index: Optional[EventIndex] = None,
+                   room_index: Optional[Dict[str, dict]] = None,
+                   *, fast_fail: bool = False) -> Tuple[bool, List[str]]:
     """Validate all event scheduling prerequisites.
     
     Checks:
@@ -331,6 +544,12 @@ def validate_event(event: dict, existing_events: List[dict], rooms: List[dict],
         existing_events: List of existing events to check conflicts against
         rooms: List of available rooms
         booking_date: Date of booking in YYYY-MM-DD format or None (defaults to today)
+        event_index: Optional prebuilt build_event_index(existing_events)
+        room_index: Optional prebuilt build_room_index(rooms); when given,
+            the room is looked up there instead of scanning rooms
+        fast_fail: If True, run the cheapest checks first (advance notice,
+            operating hours, capacity, then conflicts) and stop at the first
+            failure. Useful for bulk validation; the default reports every error.
         
     Returns:
         (ok, errors) - ok is True if all validations pass
@@ -339,38 +558,48 @@ def validate_event(event: dict, existing_events: List[dict], rooms: List[dict],
     
     # Find the room for capacity check
     event_room_id = event.get("room_id", "").strip()
-    room = None
-    for r in rooms:
-        if r.get("room_id", "").strip() == event_room_id:
-            room = r
-            break
+    if room_index is not None:
+        room = room_index.get(event_room_id)
+    else:
+        room = None
+        for r in rooms:
+            if r.get("room_id", "").strip() == event_room_id:
+                room = r
+                break
     
     if room is None:
         return False, [f"Room {event_room_id} not found"]
     
-    # Check conflict detection
-    ok, msg = detect_event_conflicts(event, existing_events)
-    if not ok:
-        errors.append(msg)
-    
-    # Check room capacity
-    ok, msg = validate_room_capacity(event, room)
-    if not ok:
-        errors.append(msg)
-    
-    # Check advance notice
     event_date = event.get("event_date", "").strip()
-    if event_date:
-        ok, msg = validate_advance_notice(event_date, booking_date)
-        if not ok:
-            errors.append(msg)
-    
-    # Check operating hours
     start_time = event.get("start_time", "").strip()
     end_time = event.get("end_time", "").strip()
-    if event_date and start_time and end_time:
-        ok, msg = validate_operating_hours(event_date, start_time, end_time)
+    
+    def check_conflicts():
+        return detect_event_conflicts(event, existing_events, event_index)
+    
+    def check_capacity():
+        return validate_room_capacity(event, room)
+    
+    def check_advance_notice():
+        if not event_date:
+            return True, ""
+        return validate_advance_notice(event_date, booking_date)
+    
+    def check_operating_hours():
+        if not (event_date and start_time and end_time):
+            return True, ""
+        return validate_operating_hours(event_date, start_time, end_time)
+    
+    if fast_fail:
+        checks = (check_advance_notice, check_operating_hours, check_capacity, check_conflicts)
+    else:
+        checks = (check_conflicts, check_capacity, check_advance_notice, check_operating_hours)
+    
+    for check in checks:
+        ok, msg = check()
         if not ok:
+            if fast_fail:
+                return False, [msg]
             errors.append(msg)
     
     return (len(errors) == 0), errors
@@ -19,6 +19,7 @@ if (Test-Path ".\requirements.txt") {
 $scriptList = @(
     'simulate_day.py',
     'generate_reports.py',
+    'test_generate_reports.py',
     'test_validation.py',
     'demo_validation.py',
     'test_transaction_management.py',
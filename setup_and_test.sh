@@ -25,6 +25,7 @@ fi
 script_list=(
     "simulate_day.py"
     "generate_reports.py"
+    "test_generate_reports.py"
     "test_validation.py"
     "demo_validation.py"
     "test_transaction_management.py"